@@ -5,6 +5,7 @@ FastAPI with WebSocket support, multi-provider AI, and ReAct agent
 import os
 import sys
 import json
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime
 
@@ -15,14 +16,16 @@ from pydantic import BaseModel
 from typing import Optional, List
 
 # Add current directory to path
-sys.path.insert(0, os.path.dirname(__file__))
+_BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
 
 from config import settings
 from routers import chat, voice, tasks
 from services.memory import MemoryService
 from services.automation import AutomationService
 from services.providers.router import AIRouter, initialize_ai_router
-from services.react_agent import ReActAgent
+from services.react_agent import ReActAgent, start_loading_tools
 
 
 # Request/Response Models
@@ -68,6 +71,9 @@ async def lifespan(app: FastAPI):
     )
     app.state.scheduler.start()
     
+    # Import the agent tools once, off the event loop, before the first request needs them
+    start_loading_tools()
+    
     print("[INFO] Jarvis Backend initialized")
     print(f"   Provider: {app.state.ai_router.active_provider}")
     print(f"   Model: {app.state.ai_router.get_provider().model if app.state.ai_router.get_provider() else 'None'}")
@@ -81,6 +87,12 @@ async def lifespan(app: FastAPI):
         await app.state.ai_router.close()
     if hasattr(app.state, 'automation') and app.state.automation:
         app.state.automation.shutdown()
+    from tools.markx_actions import close_http
+    await close_http()
+    from tools.email_sender_async import close_email_pool
+    await close_email_pool()
+    from tools.computer_control import close_cpu_sampler
+    await close_cpu_sampler()
     
     print("[INFO] Jarvis Backend shutdown")
 
@@ -175,6 +187,23 @@ async def list_models():
 
 
 # WebSocket for real-time chat
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-run
+_background_tasks = set()
+
+
+def _on_background_done(task: asyncio.Task):
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        print(f"[WARNING] Background task failed: {task.exception()}")
+
+
+def _run_in_background(coro):
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_done)
+    return task
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time chat with step streaming"""
@@ -246,11 +275,11 @@ async def websocket_endpoint(websocket: WebSocket):
                         "summary": agent.get_summary()
                     })
                     
-                    # Store in memory
-                    await app.state.memory.store_conversation(
+                    # Store in memory in the background so the next message is read right away
+                    _run_in_background(app.state.memory.store_conversation(
                         user_message=content,
-                        assistant_response=final_response
-                    )
+                        assistant_message=final_response
+                    ))
                 except Exception as e:
                      await websocket.send_json({
                         "type": "error",
@@ -288,9 +317,19 @@ async def root():
 # Run server
 if __name__ == "__main__":
     import uvicorn
+    
+    # uvloop (libuv) is POSIX-only; Windows keeps the default Proactor loop.
+    # Blocking calls must stay off the loop (asyncio.to_thread) either way.
+    try:
+        import uvloop  # noqa: F401
+        event_loop = "uvloop"
+    except ImportError:
+        event_loop = "asyncio"
+    
     uvicorn.run(
         "main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        loop=event_loop
     )
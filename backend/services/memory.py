@@ -2,9 +2,10 @@
 Memory Service
 Persistent memory using Supabase for conversations, knowledge, and preferences
 """
+import asyncio
 import os
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 from config import get_settings
 
 # For now, use local JSON file as fallback if Supabase not configured
@@ -52,6 +53,9 @@ class MemoryService:
                     "preferences": {}
                 }, f)
         
+        # Serializes read-modify-write cycles on the local memory file
+        self._local_lock = asyncio.Lock()
+        
         # Initialize Vector Memory
         try:
              self.vector_store = VectorMemoryService(persist_path=os.path.join(os.path.dirname(__file__), '..', 'data', 'vector_store'))
@@ -70,9 +74,18 @@ class MemoryService:
             return {"conversations": [], "memories": [], "preferences": {}}
     
     async def _save_local_memory(self, data: dict):
-        """Save memory to local JSON file"""
-        async with aiofiles.open(self.local_memory_path, 'w') as f:
+        """Save memory to local JSON file (temp file + rename, so readers never see a partial file)"""
+        tmp_path = f"{self.local_memory_path}.tmp"
+        async with aiofiles.open(tmp_path, 'w') as f:
             await f.write(json.dumps(data, indent=2))
+        os.replace(tmp_path, self.local_memory_path)
+    
+    async def _update_local_memory(self, update: Callable[[dict], None]):
+        """Load, modify and save the local memory file as one step; concurrent writers queue on the lock"""
+        async with self._local_lock:
+            data = await self._load_local_memory()
+            update(data)
+            await self._save_local_memory(data)
     
     async def store_conversation(self, user_message: str, assistant_message: str):
         """Store a conversation exchange"""
@@ -88,42 +101,47 @@ class MemoryService:
             except Exception as e:
                 print(f"Error storing to Supabase: {e}")
                 # Fallback to local
-                data = await self._load_local_memory()
-                data["conversations"].append(conversation)
-                await self._save_local_memory(data)
+                await self._update_local_memory(lambda data: data["conversations"].append(conversation))
         else:
-            data = await self._load_local_memory()
-            data["conversations"].append(conversation)
-            await self._save_local_memory(data)
+            await self._update_local_memory(lambda data: data["conversations"].append(conversation))
     
     async def store_memory(self, category: str, content: str, importance: int = 5):
         """Store a memory item"""
-        memory = {
-            "category": category,
-            "content": content,
-            "importance": importance,
-            "created_at": datetime.now().isoformat()
-        }
+        await self.store_memories(category, [content], importance)
+    
+    async def store_memories(self, category: str, contents: list, importance: int = 5):
+        """Store several memory items with one save and one vector-store batch"""
+        if not contents:
+            return
+        
+        created_at = datetime.now().isoformat()
+        memories = [
+            {
+                "category": category,
+                "content": content,
+                "importance": importance,
+                "created_at": created_at
+            }
+            for content in contents
+        ]
         
         if self.supabase_client:
             try:
-                self.supabase_client.table("memories").insert(memory).execute()
+                self.supabase_client.table("memories").insert(memories).execute()
             except Exception as e:
-                print(f"Error storing memory to Supabase: {e}")
-                data = await self._load_local_memory()
-                data["memories"].append(memory)
-                await self._save_local_memory(data)
+                print(f"Error storing memories to Supabase: {e}")
+                await self._update_local_memory(lambda data: data["memories"].extend(memories))
         else:
-            data = await self._load_local_memory()
-            data["memories"].append(memory)
-            await self._save_local_memory(data)
-            
-        # Store in Vector DB as well for semantic search
+            await self._update_local_memory(lambda data: data["memories"].extend(memories))
+        
         if self.vector_store:
             try:
-                self.vector_store.add_memory(
-                    text=content,
-                    metadata={"category": category, "importance": importance, "source": "memory_service"}
+                self.vector_store.add_memories(
+                    texts=list(contents),
+                    metadatas=[
+                        {"category": category, "importance": importance, "source": "memory_service"}
+                        for _ in contents
+                    ]
                 )
             except Exception as e:
                 print(f"Error adding to Vector DB: {e}")
@@ -220,13 +238,9 @@ class MemoryService:
                 }).execute()
             except Exception as e:
                 print(f"Error saving preference to Supabase: {e}")
-                data = await self._load_local_memory()
-                data["preferences"][key] = value
-                await self._save_local_memory(data)
+                await self._update_local_memory(lambda data: data["preferences"].update({key: value}))
         else:
-            data = await self._load_local_memory()
-            data["preferences"][key] = value
-            await self._save_local_memory(data)
+            await self._update_local_memory(lambda data: data["preferences"].update({key: value}))
     
     async def get_preference(self, key: str, default=None):
         """Get a user preference"""
@@ -328,12 +342,11 @@ class MemoryService:
     
     async def store_entities(self, entities: list, source: str = "conversation"):
         """Store extracted entities as memories"""
-        for entity in entities:
-            await self.store_memory(
-                category="entity",
-                content=f"{entity} (from {source})",
-                importance=4
-            )
+        await self.store_memories(
+            category="entity",
+            contents=[f"{entity} (from {source})" for entity in entities],
+            importance=4
+        )
     
     async def build_system_context(self) -> str:
         """Build context string for system prompt injection"""
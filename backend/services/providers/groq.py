@@ -1,10 +1,21 @@
 """
 Groq Provider - Fast cloud LLM API
 """
-from groq import AsyncGroq
+import httpx
+from groq import AsyncGroq, DefaultAsyncHttpxClient
 from typing import Optional, AsyncGenerator
 import json
 
+# h2 enables HTTP/2 on the API connection when available
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# httpx drops idle connections after 5s by default; keep them across chat turns
+KEEPALIVE_EXPIRY_S = 60
+
 
 class GroqProvider:
     """Groq API client for fast cloud inference"""
@@ -12,7 +23,13 @@ class GroqProvider:
     def __init__(self, api_key: str, model: str = "llama-3.3-70b-versatile"):
         self.api_key = api_key
         self.model = model
-        self.client = AsyncGroq(api_key=api_key)
+        self.client = AsyncGroq(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=KEEPALIVE_EXPIRY_S),
+            ),
+        )
     
     async def check_connection(self) -> bool:
         """Check if Groq API is accessible"""
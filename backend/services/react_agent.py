@@ -3,6 +3,7 @@ ReAct Agent - Plan-Execute-Observe Loop Orchestration
 Implements the ReAct paradigm for autonomous task execution
 """
 import asyncio
+import contextlib
 import json
 import uuid
 import os
@@ -13,8 +14,17 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 # Add parent directory to path for tools import
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+from config import settings
+from tools.results import ToolFailure
 from .providers.router import AIRouter, get_ai_router
 
 # Lazy import tools to avoid circular imports
@@ -30,30 +40,23 @@ get_system_info = None
 def _load_tools():
     global _tools_loaded, open_application, open_url, web_search, run_safe_command, read_file, write_file, get_system_info
     if not _tools_loaded:
-        from tools.computer_control import (
-            open_application as _open_application,
-            open_url as _open_url,
-            web_search as _web_search,
-            run_safe_command as _run_safe_command,
-            read_file as _read_file,
-            write_file as _write_file,
-            get_system_info as _get_system_info
-        )
+        from tools.computer_control import ComputerControl
+        computer = ComputerControl()
         
         # OpenClaw Tools
         from tools.stealth_browser import open_stealth_browser
         from tools.youtube import run_youtube_task
-        from tools.email_sender import send_email_tool
+        from tools.email_sender_async import send_email_tool_async
         from tools.memory_system import run_memory_tool
         from tools.markx_actions import send_message as _send_message, weather_report as _weather_report, markx_web_search as _markx_web_search, aircraft_report as _aircraft_report
 
-        open_application = _open_application
-        open_url = _open_url
-        web_search = _web_search
-        run_safe_command = _run_safe_command
-        read_file = _read_file
-        write_file = _write_file
-        get_system_info = _get_system_info
+        open_application = computer.open_application
+        open_url = computer.open_url
+        web_search = computer.web_search
+        run_safe_command = computer.run_command
+        read_file = computer.read_file
+        write_file = computer.write_file
+        get_system_info = computer.get_system_info
         
         # Mark-X Tools
         globals()['send_message_markx'] = _send_message
@@ -64,11 +67,32 @@ def _load_tools():
         # Assign new tools to global variants (optional, but good for consistency)
         globals()['open_stealth_browser'] = open_stealth_browser
         globals()['run_youtube_task'] = run_youtube_task
-        globals()['send_email_tool'] = send_email_tool
+        globals()['send_email_tool_async'] = send_email_tool_async
         globals()['run_memory_tool'] = run_memory_tool
         _tools_loaded = True
 
 
+# Process-wide import of the tool modules, shared by every agent
+_tools_load: Optional[asyncio.Future] = None
+
+def start_loading_tools() -> asyncio.Future:
+    """
+    Start importing the tool modules off the event loop, once per process,
+    and return the shared future. Call at app startup to warm the imports.
+    """
+    global _tools_load
+    loop = asyncio.get_running_loop()
+    if _tools_load is None or _tools_load.get_loop() is not loop or _tools_load.cancelled():
+        _tools_load = loop.create_task(asyncio.to_thread(_load_tools))
+        _tools_load.add_done_callback(_report_tools_load)
+    return _tools_load
+
+def _report_tools_load(future: asyncio.Future):
+    # Retrieving the exception here also keeps asyncio from logging it as never retrieved
+    if not future.cancelled() and future.exception() is not None:
+        print(f"[WARNING] Agent tools failed to load: {future.exception()!r}")
+
+
 class StepType(str, Enum):
     THINKING = "thinking"
     PLANNING = "planning"
@@ -78,7 +102,7 @@ class StepType(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentStep:
     """Single step in the ReAct loop"""
     id: str
@@ -289,12 +313,13 @@ TOOLS = [
         "type": "function",
         "function": {
             "name": "weather_report",
-            "description": "Get weather report for a city (opens in browser)",
+            "description": "Get weather report for a city (can also open the forecast in the browser)",
             "parameters": {
                 "type": "object",
                 "properties": {
                     "city": {"type": "string", "description": "City name"},
-                    "time_query": {"type": "string", "description": "Time (today, tomorrow)", "default": "today"}
+                    "time_query": {"type": "string", "description": "Time (today, tomorrow)", "default": "today"},
+                    "open_browser": {"type": "boolean", "description": "Also open the forecast in the browser", "default": False}
                 },
                 "required": ["city"]
             }
@@ -405,6 +430,61 @@ ADVANCED_TOOLS = [
 ]
 
 
+# Argument validators for the static tool set, compiled once at import
+_TOOL_SCHEMAS = {t["function"]["name"]: t["function"]["parameters"] for t in TOOLS + ADVANCED_TOOLS}
+_VALIDATORS = (
+    {name: fastjsonschema.compile(schema) for name, schema in _TOOL_SCHEMAS.items()}
+    if fastjsonschema else {}
+)
+
+# Runs execute_python code (read from stdin) with the restricted builtins in a child process
+_PYTHON_RUNNER = """
+import sys
+code = sys.stdin.read()
+safe_builtins = {"print": print, "range": range, "len": len, "str": str, "int": int, "float": float, "list": list, "dict": dict}
+try:
+    exec(code, {"__builtins__": safe_builtins})
+except Exception as e:
+    sys.stdout.flush()
+    sys.stderr.write(str(e))
+    sys.exit(1)
+"""
+
+async def _run_python(code: str) -> str:
+    """Run model-written code in an isolated interpreter that is killed if the caller gives up"""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-I", "-c", _PYTHON_RUNNER,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await process.communicate(code.encode())
+    except asyncio.CancelledError:
+        # Timed out (or the run was abandoned): an endless loop must not outlive the call
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+        raise
+    if process.returncode != 0:
+        return f"Python error: {stderr.decode(errors='replace')}"
+    return stdout.decode(errors="replace") or "Code executed successfully (no output)"
+
+# Sentinel marking the end of a run on the step queue
+_RUN_FINISHED = object()
+
+# Read-only tools whose results can be reused within a single task
+CACHEABLE_TOOLS = frozenset({
+    "markx_search",
+    "recall",
+    "weather_report",
+    "aircraft_tracker",
+})
+CACHEABLE_YOUTUBE_ACTIONS = frozenset({"metadata", "transcript"})
+# Tools that write memories; they invalidate cached recall results
+MEMORY_WRITE_TOOLS = frozenset({"remember", "memory_tool"})
+
+
 class ReActAgent:
     """
     ReAct Agent with Plan-Execute-Observe loop.
@@ -418,11 +498,28 @@ class ReActAgent:
         max_steps: int = 50,
         token_budget: int = 100000,
         memory_service = None,
-        automation_service = None
+        automation_service = None,
+        llm_timeout_s: float = 60,
+        tool_timeout_s: float = 30
     ):
         self.router = router or get_ai_router()
         self.max_steps = max_steps
         self.token_budget = token_budget
+        self.llm_timeout_s = llm_timeout_s
+        self.tool_timeout_s = tool_timeout_s
+        # Per-tool overrides of tool_timeout_s (seconds)
+        self._tool_timeouts: dict[str, float] = {
+            "stealth_browser": 30,
+            "send_email": 20,
+            "web_search": 10,
+            "markx_search": 15,
+            "weather_report": 15,
+            "aircraft_tracker": 15,
+            "execute_python": 5,
+            "run_command": 15,
+            "execute_shell": 35,
+            "youtube_tool": 300,
+        }
         self.memory = memory_service
         self.automation = automation_service
         
@@ -431,10 +528,12 @@ class ReActAgent:
         from tools.dynamic import DynamicTooler
         self.system_tools = SystemTools()
         self.dynamic_tooler = DynamicTooler()
+        self.serpapi_api_key = settings.serpapi_api_key
         
         self.steps: list[AgentStep] = []
         self.total_tokens = 0
         self.task_id = None
+        self._tool_result_cache: dict[tuple, str] = {}
         
     def _get_tools_for_mode(self, mode: str) -> list:
         """Get available tools based on mode"""
@@ -451,24 +550,76 @@ class ReActAgent:
             
         return tools
     
+    def _tool_cache_key(self, tool_name: str, args: dict) -> Optional[tuple]:
+        """Build a cache key for idempotent tool calls, or None if the call must not be cached"""
+        if tool_name == "youtube_tool":
+            if args.get("action") not in CACHEABLE_YOUTUBE_ACTIONS:
+                return None
+        elif tool_name not in CACHEABLE_TOOLS:
+            return None
+        elif tool_name == "weather_report" and args.get("open_browser"):
+            # Opening the browser is a side effect a cached result would skip
+            return None
+        elif tool_name == "markx_search" and not self.serpapi_api_key:
+            # Without SerpApi the search just opens the browser
+            return None
+        
+        canonical = dict(args)
+        if isinstance(canonical.get("query"), str):
+            # The model often re-issues the same query with different casing/spacing
+            canonical["query"] = " ".join(canonical["query"].split()).casefold()
+        return (tool_name, json.dumps(canonical, sort_keys=True, default=str))
+    
     async def execute_tool(self, tool_name: str, args: dict) -> str:
-        """Execute a tool and return the result"""
-        _load_tools()  # Lazy load tools
+        """Execute a tool and return the result, reusing results of repeated read-only calls"""
+        # System and dynamic tools ship their own schemas (e.g. open_application takes
+        # app_name there) and win dispatch, so the static validator does not apply to them
+        shadowed = hasattr(self.system_tools, tool_name) or tool_name in self.dynamic_tooler.loaded_tools
+        validator = None if shadowed else _VALIDATORS.get(tool_name)
+        if validator is not None:
+            try:
+                validator(args)
+            except fastjsonschema.JsonSchemaException as e:
+                # Reject before dispatch so the model can correct the call from this observation
+                return f"Invalid args for {tool_name}: {e.message}. Schema: {json.dumps(_TOOL_SCHEMAS[tool_name])}"
+        
+        cache_key = self._tool_cache_key(tool_name, args)
+        if cache_key is not None and cache_key in self._tool_result_cache:
+            return self._tool_result_cache[cache_key]
+        
+        result = await self._dispatch_tool(tool_name, args)
+        
+        if tool_name in MEMORY_WRITE_TOOLS:
+            self._tool_result_cache = {
+                key: value for key, value in self._tool_result_cache.items() if key[0] != "recall"
+            }
+        
+        if cache_key is not None and not isinstance(result, ToolFailure):
+            self._tool_result_cache[cache_key] = result
+        return result
+    
+    async def _dispatch_tool(self, tool_name: str, args: dict) -> str:
+        """
+        Route a tool call to its implementation.
+        Blocking tools run in worker threads (model-written Python in a child process)
+        so the caller's timeout can abandon them.
+        """
         try:
             # Check for System Tools (God Mode)
             if hasattr(self.system_tools, tool_name):
                 method = getattr(self.system_tools, tool_name)
                 # Map arguments
                 if tool_name == "open_application":
-                    return method(args.get("app_name", args.get("name", "")))
+                    return await asyncio.to_thread(method, args.get("app_name", args.get("name", "")))
                 elif tool_name == "execute_shell":
-                    return method(args.get("command", ""))
+                    return await method(args.get("command", ""))
                 elif tool_name == "read_file_system":
-                    return method(args.get("path", ""))
+                    return await asyncio.to_thread(method, args.get("path", ""))
             
             # Check for Dynamic Tooler (Creation)
             if tool_name == "create_tool":
-                return self.dynamic_tooler.create_tool(
+                return await asyncio.to_thread(
+                    self.dynamic_tooler.create_tool,
                     args.get("name", ""),
                     args.get("python_code", ""),
                     args.get("description", "")
@@ -477,82 +628,83 @@ class ReActAgent:
             # Check for Custom Dynamic Tools Execution
             # The dynamic_tooler manages the list of known custom tools
             if tool_name in self.dynamic_tooler.loaded_tools:
-                return self.dynamic_tooler.execute_tool(tool_name, args)
+                return await asyncio.to_thread(self.dynamic_tooler.execute_tool, tool_name, args)
             
-            # Check for Custom Dynamic Tools
-            # (In a real implementation we would load these dynamically)
+            if tool_name == "remember":
+                if self.memory:
+                    await self.memory.store_memory(
+                        "fact",
+                        f"{args.get('key', '')}: {args.get('value', '')}"
+                    )
+                    return f"Remembered: {args.get('key')}"
+                return ToolFailure("Memory service not available")
             
+            elif tool_name == "recall":
+                if self.memory:
+                    memories = await self.memory.search_memory(args.get("query", ""))
+                    if memories:
+                        return "\n".join([f"- {m.get('content', '')}" for m in memories[:5]])
+                    return "No memories found"
+                return ToolFailure("Memory service not available")
+            
+            elif tool_name == "execute_python":
+                # Basic Python execution (will be sandboxed in Phase 3)
+                code = args.get("code", "")
+                # Safety check
+                dangerous = ["import os", "import sys", "subprocess", "eval(", "exec(", "__import__"]
+                for d in dangerous:
+                    if d in code:
+                        return f"Error: Unsafe code detected ({d})"
+                return await _run_python(code)
+        except Exception as e:
+            return ToolFailure(f"Tool error: {str(e)}")
+        
+        # The remaining tools live in the lazily imported tool modules
+        try:
+            # Shielded: a tool call's timeout must not cancel the load every agent shares
+            await asyncio.shield(start_loading_tools())
+        except Exception as e:
+            return ToolFailure(f"Tool error: tools failed to load: {e}")
+        
+        try:
             # Standard Tools
             if tool_name == "open_application":
-                return open_application(args.get("name", ""))
+                name = args.get("name", "")
+                return f"Opened {name}" if await open_application(name) else f"Could not open {name}"
             
             elif tool_name == "open_url":
-                return open_url(args.get("url", ""))
+                url = args.get("url", "")
+                return f"Opened {url}" if await open_url(url) else f"Could not open {url}"
             
             elif tool_name == "web_search":
-                return web_search(args.get("query", ""))
+                query = args.get("query", "")
+                return f"Opened a web search for: {query}" if await web_search(query) else f"Could not search for: {query}"
             
             elif tool_name == "run_command":
-                return run_safe_command(args.get("command", ""))
+                return await run_safe_command(args.get("command", ""))
             
             elif tool_name == "read_file":
-                return read_file(args.get("path", ""))
+                return await read_file(args.get("path", ""))
             
             elif tool_name == "write_file":
-                return write_file(args.get("path", ""), args.get("content", ""))
+                path = args.get("path", "")
+                return f"Wrote {path}" if await write_file(path, args.get("content", "")) else f"Could not write {path}"
             
             elif tool_name == "get_system_info":
-                return get_system_info()
-            
-            elif tool_name == "remember":
-                if self.memory:
-                    await self.memory.store_memory(
-                        args.get("key", ""),
-                        args.get("value", ""),
-                        "fact"
-                    )
-                    return f"Remembered: {args.get('key')}"
-                return "Memory service not available"
-            
-            elif tool_name == "recall":
-                if self.memory:
-                    memories = await self.memory.search_memories(args.get("query", ""))
-                    if memories:
-                        return "\n".join([f"- {m.get('content', '')}" for m in memories[:5]])
-                    return "No memories found"
-                return "Memory service not available"
-            
-            elif tool_name == "execute_python":
-                # Basic Python execution (will be sandboxed in Phase 3)
-                code = args.get("code", "")
-                try:
-                    # Safety check
-                    dangerous = ["import os", "import sys", "subprocess", "eval(", "exec(", "__import__"]
-                    for d in dangerous:
-                        if d in code:
-                            return f"Error: Unsafe code detected ({d})"
-                    
-                    # Capture output
-                    import io
-                    import contextlib
-                    
-                    output = io.StringIO()
-                    with contextlib.redirect_stdout(output):
-                        exec(code, {"__builtins__": {"print": print, "range": range, "len": len, "str": str, "int": int, "float": float, "list": list, "dict": dict}})
-                    return output.getvalue() or "Code executed successfully (no output)"
-                except Exception as e:
-                    return f"Python error: {str(e)}"
+                return await get_system_info("all")
             
             # --- Advanced Tools ---
             elif tool_name == "stealth_browser":
-                return globals()['open_stealth_browser'](
+                return await asyncio.to_thread(
+                    globals()['open_stealth_browser'],
                     args.get("url"),
                     args.get("headless", True),
                     args.get("session")
                 )
             
             elif tool_name == "youtube_tool":
-                return globals()['run_youtube_task'](
+                return await asyncio.to_thread(
+                    globals()['run_youtube_task'],
                     args.get("action"),
                     args.get("url"),
                     lang=args.get("lang", "en"),
@@ -560,7 +712,7 @@ class ReActAgent:
                 )
             
             elif tool_name == "send_email":
-                return globals()['send_email_tool'](
+                return await globals()['send_email_tool_async'](
                     args.get("to"),
                     args.get("subject"),
                     args.get("body"),
@@ -569,10 +721,7 @@ class ReActAgent:
                 )
             
             elif tool_name == "memory_tool":
-                return globals()['run_memory_tool'](
-                    args.get("action"),
-                    **args
-                )
+                return await asyncio.to_thread(globals()['run_memory_tool'], **args)
             
             # --- Mark-X Tools ---
             elif tool_name == "send_message":
@@ -585,15 +734,14 @@ class ReActAgent:
             elif tool_name == "weather_report":
                 return await globals()['weather_report_markx'](
                     args.get("city", ""),
-                    args.get("time_query", "today")
+                    args.get("time_query", "today"),
+                    args.get("open_browser", False)
                 )
                 
             elif tool_name == "markx_search":
-                # Import settings safely inside execution to avoid circular deps if any
-                from config import settings
                 return await globals()['markx_web_search'](
                     args.get("query", ""),
-                    api_key=settings.serpapi_api_key
+                    api_key=self.serpapi_api_key
                 )
                 
             elif tool_name == "aircraft_tracker":
@@ -605,7 +753,7 @@ class ReActAgent:
                 return f"Unknown tool: {tool_name}"
         
         except Exception as e:
-            return f"Tool error: {str(e)}"
+            return ToolFailure(f"Tool error: {str(e)}")
     
     async def run(
         self,
@@ -617,130 +765,195 @@ class ReActAgent:
         """
         Run the ReAct loop for a user message.
         Yields AgentStep objects for each step in the process.
-        """
-        self.task_id = str(uuid.uuid4())[:8]
-        self.steps = []
-        self.total_tokens = 0
-        
-        # Build initial messages
-        system_prompt = REACT_SYSTEM_PROMPT
-        if mode == "true_jarvis":
-             system_prompt += "\n\n**WARNING: YOU ARE IN TRUE JARVIS MODE.** You have full access to the system. Act responsibly."
-        
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add conversation history
-        if conversation_history:
-            messages.extend(conversation_history[-10:])  # Last 10 messages
-        
-        # Add user message
-        messages.append({"role": "user", "content": user_message})
-        
-        step_count = 0
-        available_tools = self._get_tools_for_mode(mode)
         
-        while step_count < self.max_steps and self.total_tokens < self.token_budget:
-            step_count += 1
-            start_time = datetime.now()
+        The loop runs as a separate producer task feeding a bounded queue, so tool
+        execution is not paced by how fast the caller consumes steps.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+        producer = asyncio.create_task(
+            self._run_impl(user_message, conversation_history, mode, queue)
+        )
+        try:
+            while True:
+                step = await queue.get()
+                if step is _RUN_FINISHED:
+                    break
+                yield step
+            # Surface any exception raised inside the loop
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+            # Reap the producer so it cannot outlive an abandoned consumer
+            await asyncio.wait([producer])
+            if not producer.cancelled():
+                producer.exception()  # Already surfaced above unless the consumer stopped early
+    
+    async def _run_impl(
+        self,
+        user_message: str,
+        conversation_history: Optional[list],
+        mode: str,
+        queue: asyncio.Queue
+    ) -> None:
+        """ReAct loop body: pushes each AgentStep onto the queue, then _RUN_FINISHED"""
+        try:
+            self.task_id = str(uuid.uuid4())[:8]
+            self.steps = []
+            self.total_tokens = 0
+            self._tool_result_cache = {}
             
-            # Get AI response
-            response = await self.router.chat(messages, tools=available_tools)
+            # Build initial messages
+            system_prompt = REACT_SYSTEM_PROMPT
+            if mode == "true_jarvis":
+                 system_prompt += "\n\n**WARNING: YOU ARE IN TRUE JARVIS MODE.** You have full access to the system. Act responsibly."
             
-            if response.get("error"):
-                error_step = AgentStep(
-                    id=f"{self.task_id}-{step_count}",
-                    type=StepType.ERROR,
-                    content=response.get("content", "Unknown error")
-                )
-                self.steps.append(error_step)
-                yield error_step
-                return
+            messages = [{"role": "system", "content": system_prompt}]
             
-            # Track tokens
-            usage = response.get("usage", {})
-            self.total_tokens += usage.get("total_tokens", 0)
+            # Add conversation history
+            if conversation_history:
+                messages.extend(conversation_history[-10:])  # Last 10 messages
             
-            duration = int((datetime.now() - start_time).total_seconds() * 1000)
+            # Add user message
+            messages.append({"role": "user", "content": user_message})
             
-            # Check for tool calls
-            tool_calls = response.get("tool_calls")
+            step_count = 0
+            available_tools = self._get_tools_for_mode(mode)
             
-            if tool_calls:
-                # Execute each tool call
-                for tc in tool_calls:
-                    func = tc.get("function", {})
-                    tool_name = func.get("name", "")
-                    
-                    try:
-                        tool_args = json.loads(func.get("arguments", "{}"))
-                    except json.JSONDecodeError:
-                        tool_args = {}
-                    
-                    # Emit tool call step
-                    tool_step = AgentStep(
-                        id=f"{self.task_id}-{step_count}-tool",
-                        type=StepType.TOOL_CALL,
-                        content=f"Calling {tool_name}",
-                        tool_name=tool_name,
-                        tool_args=tool_args,
-                        duration_ms=duration,
-                        tokens_used=usage.get("total_tokens", 0)
-                    )
-                    self.steps.append(tool_step)
-                    yield tool_step
-                    
-                    # Execute tool
-                    result = await self.execute_tool(tool_name, tool_args)
-                    
-                    # Emit observation step
-                    obs_step = AgentStep(
-                        id=f"{self.task_id}-{step_count}-obs",
-                        type=StepType.OBSERVATION,
-                        content=result[:1000],  # Truncate long results
-                        tool_name=tool_name,
-                        tool_result=result
+            while step_count < self.max_steps and self.total_tokens < self.token_budget:
+                step_count += 1
+                start_time = datetime.now()
+                
+                # Get AI response
+                try:
+                    async with asyncio.timeout(self.llm_timeout_s):
+                        response = await self.router.chat(messages, tools=available_tools)
+                except TimeoutError:
+                    response = {
+                        "content": f"AI provider did not respond within {self.llm_timeout_s}s",
+                        "tool_calls": None,
+                        "error": True
+                    }
+                
+                if response.get("error"):
+                    error_step = AgentStep(
+                        id=f"{self.task_id}-{step_count}",
+                        type=StepType.ERROR,
+                        content=response.get("content", "Unknown error")
                     )
-                    self.steps.append(obs_step)
-                    yield obs_step
-                    
-                    # Add to messages for next iteration
+                    self.steps.append(error_step)
+                    await queue.put(error_step)
+                    return
+                
+                # Track tokens
+                usage = response.get("usage", {})
+                self.total_tokens += usage.get("total_tokens", 0)
+                
+                duration = int((datetime.now() - start_time).total_seconds() * 1000)
+                
+                # Check for tool calls
+                tool_calls = response.get("tool_calls")
+                
+                if tool_calls:
+                    # A single assistant turn carries every tool call; each result
+                    # follows as its own tool message (OpenAI tool-calling layout)
                     messages.append({
                         "role": "assistant",
                         "content": None,
-                        "tool_calls": [tc]
-                    })
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tc.get("id", ""),
-                        "content": result
+                        "tool_calls": tool_calls
                     })
+                    
+                    # Execute each tool call
+                    for tc in tool_calls:
+                        func = tc.get("function", {})
+                        tool_name = func.get("name", "")
+                        
+                        try:
+                            tool_args = json.loads(func.get("arguments", "{}"))
+                        except json.JSONDecodeError:
+                            tool_args = {}
+                        
+                        # Emit tool call step
+                        tool_step = AgentStep(
+                            id=f"{self.task_id}-{step_count}-tool",
+                            type=StepType.TOOL_CALL,
+                            content=f"Calling {tool_name}",
+                            tool_name=tool_name,
+                            tool_args=tool_args,
+                            duration_ms=duration,
+                            tokens_used=usage.get("total_tokens", 0)
+                        )
+                        self.steps.append(tool_step)
+                        await queue.put(tool_step)
+                        
+                        # Execute tool
+                        timeout_s = self._tool_timeouts.get(tool_name, self.tool_timeout_s)
+                        try:
+                            async with asyncio.timeout(timeout_s):
+                                result = await self.execute_tool(tool_name, tool_args)
+                        except TimeoutError:
+                            # Feed the timeout back as the observation so the model can retry or pivot
+                            result = f"Tool timed out after {timeout_s}s"
+                            timeout_step = AgentStep(
+                                id=f"{self.task_id}-{step_count}-timeout",
+                                type=StepType.ERROR,
+                                content=f"{tool_name} timed out after {timeout_s}s",
+                                tool_name=tool_name
+                            )
+                            self.steps.append(timeout_step)
+                            await queue.put(timeout_step)
+                        
+                        # Emit observation step
+                        obs_step = AgentStep(
+                            id=f"{self.task_id}-{step_count}-obs",
+                            type=StepType.OBSERVATION,
+                            content=result[:1000],  # Truncate long results
+                            tool_name=tool_name,
+                            tool_result=result
+                        )
+                        self.steps.append(obs_step)
+                        await queue.put(obs_step)
+                        
+                        # Add to messages for next iteration
+                        messages.append({
+                            "role": "tool",
+                            "tool_call_id": tc.get("id", ""),
+                            "content": result
+                        })
+                
+                else:
+                    # No tool calls - this is the final response
+                    content = response.get("content", "")
+                    
+                    if content:
+                        response_step = AgentStep(
+                            id=f"{self.task_id}-{step_count}-response",
+                            type=StepType.RESPONSE,
+                            content=content,
+                            duration_ms=duration,
+                            tokens_used=usage.get("total_tokens", 0)
+                        )
+                        self.steps.append(response_step)
+                        await queue.put(response_step)
+                    
+                    # Task complete
+                    return
             
+            # Max steps or token budget reached
+            limit_step = AgentStep(
+                id=f"{self.task_id}-limit",
+                type=StepType.ERROR,
+                content=f"Task limit reached (steps: {step_count}, tokens: {self.total_tokens})"
+            )
+            self.steps.append(limit_step)
+            await queue.put(limit_step)
+        finally:
+            if asyncio.current_task().cancelling():
+                # The consumer is gone; a full queue would block this put forever
+                with contextlib.suppress(asyncio.QueueFull):
+                    queue.put_nowait(_RUN_FINISHED)
             else:
-                # No tool calls - this is the final response
-                content = response.get("content", "")
-                
-                if content:
-                    response_step = AgentStep(
-                        id=f"{self.task_id}-{step_count}-response",
-                        type=StepType.RESPONSE,
-                        content=content,
-                        duration_ms=duration,
-                        tokens_used=usage.get("total_tokens", 0)
-                    )
-                    self.steps.append(response_step)
-                    yield response_step
-                
-                # Task complete
-                return
-        
-        # Max steps or token budget reached
-        limit_step = AgentStep(
-            id=f"{self.task_id}-limit",
-            type=StepType.ERROR,
-            content=f"Task limit reached (steps: {step_count}, tokens: {self.total_tokens})"
-        )
-        self.steps.append(limit_step)
-        yield limit_step
+                await queue.put(_RUN_FINISHED)
 
     
     def get_summary(self) -> dict:
@@ -749,7 +962,7 @@ class ReActAgent:
             "task_id": self.task_id,
             "total_steps": len(self.steps),
             "total_tokens": self.total_tokens,
-            "tool_calls": sum(1 for s in self.steps if s.type == StepType.TOOL_CALL),
+            "tool_calls": sum(1 for s in self.steps if s.type is StepType.TOOL_CALL),
             "steps": [
                 {
                     "id": s.id,
@@ -1,47 +1,55 @@
-
+import asyncio
 import logging
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Daily Briefing time (local clock)
+DAILY_BRIEFING_HOUR = 8
+DAILY_BRIEFING_MINUTE = 0
+
 class SchedulerService:
     """
     Manages background scheduled tasks for Jarvis.
-    Uses APScheduler to run cron jobs like Daily Briefings.
+    Runs the Daily Briefing from a single asyncio task that sleeps until the next run.
     """
     
     def __init__(self, automation_service=None, memory_service=None):
-        self.scheduler = AsyncIOScheduler()
         self.automation = automation_service
         self.memory = memory_service
-        self._setup_jobs()
-        
-    def _setup_jobs(self):
-        """Define the schedule for all background tasks."""
-        
-        # 1. Daily Briefing (Run at 8:00 AM every day)
-        self.scheduler.add_job(
-            self.run_daily_briefing,
-            CronTrigger(hour=8, minute=0),
-            id="daily_briefing",
-            replace_existing=True
-        )
-        
-        logger.info("Scheduler jobs configured.")
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
 
     def start(self):
-        """Start the scheduler."""
-        if not self.scheduler.running:
-            self.scheduler.start()
+        """Start the scheduler. Must be called from a running event loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._daily_loop())
             logger.info("Scheduler logic started.")
 
     def shutdown(self):
         """Shutdown the scheduler."""
-        if self.scheduler.running:
-            self.scheduler.shutdown()
+        if self.running:
+            self._task.cancel()
             logger.info("Scheduler logic shutdown.")
+        self._task = None
+
+    @staticmethod
+    def seconds_until_next_run(now: datetime, hour: int = DAILY_BRIEFING_HOUR, minute: int = DAILY_BRIEFING_MINUTE) -> float:
+        """Seconds from `now` until the next occurrence of hour:minute."""
+        next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        return (next_run - now).total_seconds()
+
+    async def _daily_loop(self):
+        """Sleep until the next briefing time, run it, repeat."""
+        while True:
+            await asyncio.sleep(self.seconds_until_next_run(datetime.now()))
+            await self.run_daily_briefing()
 
     async def run_daily_briefing(self):
         """
@@ -61,13 +69,18 @@ class SchedulerService:
             # from tools.markx_actions import weather_report
             # weather = weather_report("New York") 
             
-            briefing_text = f"Good morning! It is {datetime.now().strftime('%A, %B %d')}. System is online and running in True Jarvis Mode."
+            # Each section of the briefing is its own memory; they are stored in one batch at the end
+            briefing_items = [
+                f"Good morning! It is {datetime.now().strftime('%A, %B %d')}.",
+                "System is online and running in True Jarvis Mode.",
+            ]
+            briefing_text = " ".join(briefing_items)
             
             print(f"\n[DAILY BRIEFING] {briefing_text}\n")
             
             # TODO: Push to frontend via WebSocket if possible, or store in memory
             if self.memory:
-                await self.memory.store_memory(briefing_text, {"type": "briefing", "automated": True})
+                await self.memory.store_memories("briefing", briefing_items)
                 
         except Exception as e:
             logger.error(f"Daily Briefing failed: {e}")
@@ -3,20 +3,54 @@ Text-to-Speech Service
 Edge-TTS integration for natural voice output
 """
 import io
+import re
+import time
 import asyncio
+from collections import OrderedDict
+from typing import Optional
 import edge_tts
 from config import get_settings
 import base64
 
 
+# Abbreviations spelled out for speech, matched in a single pass
+_ABBREVIATIONS = {
+    "AI": "A.I.",
+    "API": "A.P.I.",
+    "URL": "U.R.L.",
+    "HTTP": "H.T.T.P.",
+    "HTTPS": "H.T.T.P.S.",
+    "CPU": "C.P.U.",
+    "RAM": "ram",
+    "GB": "gigabytes",
+    "MB": "megabytes",
+    "KB": "kilobytes",
+}
+_ABBR_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, sorted(_ABBREVIATIONS, key=len, reverse=True))) + r')\b'
+)
+_MULTI_DOT_RE = re.compile(r'\.{2,}')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
 class TTSService:
     """Text-to-Speech service using Edge-TTS"""
     
-    def __init__(self):
+    # Edge-TTS voice catalogue is effectively static; shared by all instances
+    VOICES_TTL_S = 3600
+    _voices_cache: Optional[tuple[float, list]] = None
+    
+    def __init__(self, cache_size: int = 128):
         self.settings = get_settings()
         self.voice = self.settings.tts_voice
         self.rate = self.settings.tts_rate
         self.pitch = self.settings.tts_pitch
+        
+        # LRU of synthesized audio keyed by (text, voice, rate, pitch)
+        self._cache: OrderedDict[tuple, bytes] = OrderedDict()
+        self._cache_max = cache_size
+        # One lock per in-flight key so concurrent requests for a phrase synthesize it once
+        self._locks: dict[tuple, asyncio.Lock] = {}
     
     async def synthesize(self, text: str) -> bytes:
         """Convert text to speech and return audio bytes"""
@@ -26,20 +60,50 @@ class TTSService:
         # Normalize text for better speech
         text = self._normalize_text(text)
         
+        key = (text, self.voice, self.rate, self.pitch)
+        audio = self._cache_get(key)
+        if audio is not None:
+            return audio
+        
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have finished this phrase while we waited
+            audio = self._cache_get(key)
+            if audio is not None:
+                return audio
+            
+            try:
+                audio = await self._synthesize_uncached(*key)
+            finally:
+                self._locks.pop(key, None)
+            
+            self._cache[key] = audio
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+            return audio
+    
+    def _cache_get(self, key: tuple) -> Optional[bytes]:
+        audio = self._cache.get(key)
+        if audio is not None:
+            self._cache.move_to_end(key)
+        return audio
+    
+    async def _synthesize_uncached(self, text: str, voice: str, rate: str, pitch: str) -> bytes:
+        """Run Edge-TTS for already-normalized text"""
         communicate = edge_tts.Communicate(
             text,
-            self.voice,
-            pitch=self.pitch,
-            rate=self.rate
+            voice,
+            pitch=pitch,
+            rate=rate
         )
         
-        audio_buffer = bytearray()
+        chunks: list[bytes] = []
         
         async for chunk in communicate.stream():
             if chunk["type"] == "audio":
-                audio_buffer.extend(chunk["data"])
+                chunks.append(chunk["data"])
         
-        return bytes(audio_buffer)
+        return b"".join(chunks)
     
     async def synthesize_to_base64(self, text: str) -> str:
         """Convert text to speech and return base64 encoded audio"""
@@ -48,37 +112,23 @@ class TTSService:
     
     def _normalize_text(self, text: str) -> str:
         """Normalize text for better speech synthesis"""
-        import re
-        
-        # Replace multiple periods with single pause
-        text = re.sub(r'\.{2,}', '.', text)
+        # Collapse "..." into a single pause and excess whitespace into one space
+        text = _MULTI_DOT_RE.sub('.', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Handle common abbreviations
-        abbreviations = {
-            "AI": "A.I.",
-            "API": "A.P.I.",
-            "URL": "U.R.L.",
-            "HTTP": "H.T.T.P.",
-            "HTTPS": "H.T.T.P.S.",
-            "CPU": "C.P.U.",
-            "RAM": "ram",
-            "GB": "gigabytes",
-            "MB": "megabytes",
-            "KB": "kilobytes",
-        }
-        
-        for abbr, replacement in abbreviations.items():
-            text = re.sub(rf'\b{abbr}\b', replacement, text)
+        # Spell out common abbreviations
+        text = _ABBR_RE.sub(lambda m: _ABBREVIATIONS[m.group(1)], text)
         
         return text.strip()
     
     async def get_available_voices(self) -> list:
-        """Get list of available TTS voices"""
+        """Get list of available TTS voices (cached for VOICES_TTL_S)"""
+        cached = TTSService._voices_cache
+        if cached is not None and time.monotonic() - cached[0] < self.VOICES_TTL_S:
+            return cached[1]
+        
         voices = await edge_tts.list_voices()
-        return [
+        result = [
             {
                 "name": v["Name"],
                 "short_name": v["ShortName"],
@@ -87,6 +137,8 @@ class TTSService:
             }
             for v in voices
         ]
+        TTSService._voices_cache = (time.monotonic(), result)
+        return result
     
     def set_voice(self, voice: str):
         """Change the TTS voice"""
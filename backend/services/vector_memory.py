@@ -1,6 +1,10 @@
 
 import os
+import json
 import uuid
+import functools
+import threading
+from datetime import datetime
 from typing import List, Dict, Optional
 import logging
 
@@ -8,11 +12,175 @@ logger = logging.getLogger(__name__)
 
 try:
     import chromadb
+    from chromadb import EmbeddingFunction
     from chromadb.utils import embedding_functions
+    from chromadb.utils.embedding_functions import register_embedding_function
+    from chromadb.errors import NotFoundError
     CHROMADB_AVAILABLE = True
 except ImportError:
     CHROMADB_AVAILABLE = False
     chromadb = None
+    EmbeddingFunction = object
+    register_embedding_function = lambda cls: cls
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+    import onnxruntime as ort
+    from tokenizers import Tokenizer
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+# int8-quantized all-MiniLM-L6-v2 export (model_int8.onnx + tokenizer.json)
+ONNX_MODEL_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data", "models", "all-MiniLM-L6-v2-int8"
+)
+
+
+# Process-wide (session, tokenizer) per model directory; building a session costs ~100 ms
+_ONNX_SESSIONS: Dict[str, tuple] = {}
+_ONNX_LOCK = threading.Lock()
+
+
+def _get_onnx_session(model_dir: str = ONNX_MODEL_DIR) -> tuple:
+    """Return the shared (InferenceSession, Tokenizer) for model_dir, loading it once."""
+    cached = _ONNX_SESSIONS.get(model_dir)
+    if cached is not None:
+        return cached
+    with _ONNX_LOCK:
+        cached = _ONNX_SESSIONS.get(model_dir)
+        if cached is None:
+            so = ort.SessionOptions()
+            so.intra_op_num_threads = os.cpu_count() or 1
+            session = ort.InferenceSession(
+                os.path.join(model_dir, "model_int8.onnx"),
+                sess_options=so,
+                providers=["CPUExecutionProvider"]
+            )
+            tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+            tokenizer.enable_truncation(max_length=OnnxMiniLMEmbeddingFunction.MAX_LENGTH)
+            tokenizer.enable_padding()
+            cached = _ONNX_SESSIONS[model_dir] = (session, tokenizer)
+        return cached
+
+
+@register_embedding_function
+class OnnxMiniLMEmbeddingFunction(EmbeddingFunction):
+    """
+    all-MiniLM-L6-v2 running on ONNX Runtime with int8 weights.
+    
+    Build the model directory with:
+        optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 --task feature-extraction <dir>
+        python -c "from onnxruntime.quantization import quantize_dynamic, QuantType; quantize_dynamic('<dir>/model.onnx', '<dir>/model_int8.onnx', weight_type=QuantType.QInt8)"
+    """
+    
+    MAX_LENGTH = 256
+    
+    def __init__(self, model_dir: str = ONNX_MODEL_DIR):
+        self.model_dir = model_dir
+        self.session, self.tokenizer = _get_onnx_session(model_dir)
+        self._input_names = {i.name for i in self.session.get_inputs()}
+    
+    # Chroma persists name() + get_config() with the collection and rebuilds the
+    # function from them when a collection is opened without one
+    @staticmethod
+    def name() -> str:
+        return "onnx_minilm_l6_v2_int8"
+    
+    @staticmethod
+    def build_from_config(config: Dict) -> "OnnxMiniLMEmbeddingFunction":
+        return OnnxMiniLMEmbeddingFunction(config.get("model_dir", ONNX_MODEL_DIR))
+    
+    def get_config(self) -> Dict:
+        return {"model_dir": self.model_dir}
+    
+    def default_space(self) -> str:
+        return "cosine"
+    
+    def __call__(self, input):
+        encodings = self.tokenizer.encode_batch(list(input))
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+        
+        last_hidden_state = self.session.run(None, feeds)[0]
+        
+        # Mean-pool over real (non-padding) tokens, then L2-normalize
+        mask = attention_mask[..., None].astype(np.float32)
+        pooled = (last_hidden_state * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return [row for row in pooled.astype(np.float32)]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_embedder():
+    """
+    Process-wide embedder, shared by every VectorMemoryService instance.
+    Prefers the quantized ONNX MiniLM when its export is present, else Chroma's
+    built-in fp32 ONNX MiniLM (downloaded on first use).
+    """
+    if ONNX_AVAILABLE and os.path.exists(os.path.join(ONNX_MODEL_DIR, "model_int8.onnx")):
+        return OnnxMiniLMEmbeddingFunction()
+    logger.info("Quantized ONNX MiniLM not found; using Chroma's ONNX MiniLM embeddings.")
+    return embedding_functions.ONNXMiniLM_L6_V2()
+
+
+# Metadata value types Chroma can store
+_METADATA_SCALARS = (str, int, float, bool)
+
+
+def _json_default(value):
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _to_json(value) -> str:
+    if orjson:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, default=_json_default)
+
+
+def _sanitize_metadata(metadata: Dict) -> Dict:
+    """Coerce metadata to Chroma's scalar types (datetimes -> ISO strings, containers -> JSON)."""
+    if all(isinstance(v, _METADATA_SCALARS) for v in metadata.values()):
+        return metadata
+    # One JSON round trip normalizes datetimes, enums, numpy scalars, dataclasses...
+    metadata = (orjson.loads if orjson else json.loads)(_to_json(metadata))
+    return {
+        k: v if isinstance(v, _METADATA_SCALARS) else _to_json(v)
+        for k, v in metadata.items()
+        if v is not None
+    }
+
+
+COLLECTION_NAME = "jarvis_long_term_memory"
+
+# Model names under which a persisted sentence_transformer embedder is all-MiniLM-L6-v2
+_MINILM_MODEL_NAMES = {"all-MiniLM-L6-v2", "sentence-transformers/all-MiniLM-L6-v2"}
+
+
+def _is_minilm_embedder(ef_config: Dict) -> bool:
+    """True if a persisted embedding function config produces all-MiniLM-L6-v2 vectors."""
+    name = ef_config.get("name")
+    if name in (OnnxMiniLMEmbeddingFunction.name(), "onnx_mini_lm_l6_v2", "default"):
+        return True
+    return name == "sentence_transformer" and (ef_config.get("config") or {}).get("model_name") in _MINILM_MODEL_NAMES
+
+
+HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 100,
+    "hnsw:search_ef": 50,
+}
+
 
 class VectorMemoryService:
     def __init__(self, persist_path: str = "data/vector_store"):
@@ -28,55 +196,137 @@ class VectorMemoryService:
         # Initialize Client
         self.client = chromadb.PersistentClient(path=persist_path)
         
-        # Use a standard embedding function
-        self.ef = embedding_functions.SentenceTransformerEmbeddingFunction(
-            model_name="all-MiniLM-L6-v2"
+        # Same MiniLM embeddings either way; the ONNX int8 path is much faster on CPU
+        self.ef = _get_embedder()
+        
+        self.collection = self._open_collection()
+        self._search_ef = HNSW_METADATA["hnsw:search_ef"]
+
+    def _open_collection(self):
+        """
+        Get or create the memory collection with self.ef.
+        
+        Chroma refuses to open a collection persisted with a different embedder (e.g. one
+        created before the ONNX export was installed), so that one is migrated to self.ef.
+        """
+        staging_name = f"{COLLECTION_NAME}_migrating"
+        try:
+            staged = self.client.get_collection(staging_name, embedding_function=self.ef)
+        except NotFoundError:
+            staged = None
+        if staged is not None and COLLECTION_NAME not in {c.name for c in self.client.list_collections()}:
+            # A migration stopped between dropping the old collection and renaming its copy
+            staged.modify(name=COLLECTION_NAME)
+            return self.client.get_collection(COLLECTION_NAME, embedding_function=self.ef)
+        
+        # MiniLM embeddings are meant for cosine similarity; the space is fixed at
+        # creation, so an existing L2 collection keeps its metric.
+        try:
+            return self.client.get_or_create_collection(
+                name=COLLECTION_NAME,
+                embedding_function=self.ef,
+                metadata=HNSW_METADATA
+            )
+        except ValueError as e:
+            if "Embedding function conflict" not in str(e):
+                raise
+        return self._migrate_collection(self.client.get_collection(COLLECTION_NAME), staging_name)
+
+    def _migrate_collection(self, old, staging_name: str):
+        """
+        Copy a collection persisted with another embedder into one using self.ef.
+        
+        Vectors from another all-MiniLM-L6-v2 embedder are copied as-is; anything else is
+        re-embedded from the stored documents. The old collection is only dropped once the
+        copy is complete.
+        """
+        persisted = old.configuration_json.get("embedding_function") or {}
+        reuse_vectors = _is_minilm_embedder(persisted)
+        logger.warning(
+            "Migrating vector memory (%d memories) from the %r to the %r embedder%s.",
+            old.count(), persisted.get("name"), self.ef.name(),
+            "" if reuse_vectors else ", re-embedding documents"
         )
         
-        # Get or create collection
-        self.collection = self.client.get_or_create_collection(
-            name="jarvis_long_term_memory",
-            embedding_function=self.ef
+        try:
+            self.client.delete_collection(staging_name)
+        except NotFoundError:
+            pass
+        staged = self.client.create_collection(
+            name=staging_name,
+            embedding_function=self.ef,
+            metadata={**HNSW_METADATA, **(old.metadata or {})}
         )
+        
+        include = ["documents", "metadatas"] + (["embeddings"] if reuse_vectors else [])
+        batch_size = self.client.get_max_batch_size()
+        for offset in range(0, old.count(), batch_size):
+            batch = old.get(include=include, limit=batch_size, offset=offset)
+            staged.add(
+                ids=batch["ids"],
+                documents=batch["documents"],
+                metadatas=batch["metadatas"],
+                embeddings=batch["embeddings"] if reuse_vectors else None
+            )
+        
+        self.client.delete_collection(COLLECTION_NAME)
+        staged.modify(name=COLLECTION_NAME)
+        return self.client.get_collection(COLLECTION_NAME, embedding_function=self.ef)
 
     def add_memory(self, text: str, metadata: Dict = None):
         """Add a memory to the vector store."""
-        if metadata is None:
-            metadata = {}
+        return self.add_memories([text], [metadata] if metadata is not None else None)[0]
+
+    def add_memories(self, texts: List[str], metadatas: Optional[List[Dict]] = None) -> List[str]:
+        """Add several memories in one embedding + index pass. Returns the new ids."""
+        if not texts:
+            return []
+        if metadatas is None:
+            metadatas = [None] * len(texts)
             
-        # Add timestamp if not present
-        if "timestamp" not in metadata:
-            from datetime import datetime
-            metadata["timestamp"] = datetime.now().isoformat()
+        # One timestamp for the whole batch; explicit timestamps take precedence
+        timestamp = datetime.now().isoformat()
+        metadatas = [_sanitize_metadata({"timestamp": timestamp, **(m or {})}) for m in metadatas]
 
-        doc_id = str(uuid.uuid4())
+        doc_ids = [uuid.uuid4().hex for _ in texts]
         
         self.collection.add(
-            documents=[text],
-            metadatas=[metadata],
-            ids=[doc_id]
+            documents=list(texts),
+            metadatas=metadatas,
+            ids=doc_ids
         )
-        return doc_id
+        return doc_ids
 
-    def search_memory(self, query: str, n_results: int = 5) -> List[Dict]:
-        """Search for memories semantically."""
+    def search_memory(self, query: str, n_results: int = 5, ef_search: Optional[int] = None) -> List[Dict]:
+        """Search for memories semantically. ef_search trades recall for speed (default 50)."""
+        # Nothing to search: skip embedding the query entirely
+        total = self.collection.count()
+        if total == 0:
+            return []
+        
+        if ef_search is not None and ef_search != self._search_ef:
+            self._set_search_ef(ef_search)
+        
         results = self.collection.query(
             query_texts=[query],
-            n_results=n_results
+            n_results=min(n_results, total),
+            include=["documents", "metadatas", "distances"]
         )
         
         # Parse results into a cleaner format
-        output = []
-        if results and results['documents']:
-            for i in range(len(results['documents'][0])):
-                doc = results['documents'][0][i]
-                meta = results['metadatas'][0][i]
-                output.append({
-                    "content": doc,
-                    "metadata": meta,
-                    "distance": results['distances'][0][i] if 'distances' in results else 0
-                })
-        return output
+        return [
+            {"content": doc, "metadata": meta, "distance": dist}
+            for doc, meta, dist in zip(
+                results["documents"][0],
+                results["metadatas"][0],
+                results["distances"][0]
+            )
+        ]
+
+    def _set_search_ef(self, ef: int):
+        """Change the HNSW query-time beam width of the collection."""
+        self.collection.modify(configuration={"hnsw": {"ef_search": ef}})
+        self._search_ef = ef
 
     def count(self):
         return self.collection.count()
@@ -1,13 +1,17 @@
 
 import pytest
+import asyncio
+import json
 import sys
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from agents import ProactiveCore
+from services.react_agent import ReActAgent, StepType
+from tools.results import ToolFailure
 
 def test_proactive_core_safe_init():
     """Test that ProactiveCore initializes without error even if CrewAI is missing."""
@@ -22,3 +26,143 @@ def test_swarm_execution_safe():
     result = core.run_swarm("Test Objective")
     assert isinstance(result, str)
     # Should either be the result (if installed) or the error message
+
+def _agent(**kwargs):
+    agent = ReActAgent(router=MagicMock(), **kwargs)
+    agent.serpapi_api_key = "test-key"
+    return agent
+
+@pytest.mark.asyncio
+async def test_tool_cache_reuses_repeated_read_only_calls():
+    """A repeated read-only call (same query modulo casing/spacing) is answered from the cache."""
+    agent = _agent()
+    agent._dispatch_tool = AsyncMock(return_value="result")
+    
+    assert await agent.execute_tool("markx_search", {"query": "Python  news"}) == "result"
+    assert await agent.execute_tool("markx_search", {"query": "python news"}) == "result"
+    assert agent._dispatch_tool.await_count == 1
+    
+    # Side-effecting calls always run
+    await agent.execute_tool("weather_report", {"city": "Paris", "open_browser": True})
+    await agent.execute_tool("weather_report", {"city": "Paris", "open_browser": True})
+    assert agent._dispatch_tool.await_count == 3
+
+@pytest.mark.asyncio
+async def test_tool_cache_skips_failures():
+    """A failure observation is not replayed; the next call retries the tool."""
+    agent = _agent()
+    agent._dispatch_tool = AsyncMock(side_effect=[ToolFailure("Search failed: timeout"), "result"])
+    
+    assert await agent.execute_tool("markx_search", {"query": "news"}) == "Search failed: timeout"
+    assert await agent.execute_tool("markx_search", {"query": "news"}) == "result"
+    assert agent._dispatch_tool.await_count == 2
+
+@pytest.mark.asyncio
+async def test_memory_writes_invalidate_cached_recall():
+    """recall after remember sees the new memory instead of the cached answer."""
+    agent = _agent()
+    agent.memory = MagicMock()
+    agent.memory.store_memory = AsyncMock()
+    agent.memory.search_memory = AsyncMock(side_effect=[[], [{"content": "fact: blue"}]])
+    
+    assert await agent.execute_tool("recall", {"query": "colour"}) == "No memories found"
+    await agent.execute_tool("remember", {"key": "fact", "value": "blue"})
+    assert await agent.execute_tool("recall", {"query": "colour"}) == "- fact: blue"
+
+
+class _StubRouter:
+    """Replays scripted chat responses; a callable entry builds the response from the messages."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    async def chat(self, messages, tools=None):
+        self.calls.append(list(messages))
+        response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        return response(messages) if callable(response) else response
+
+
+def _tool_call(name, args, call_id="call-1"):
+    return {
+        "content": None,
+        "tool_calls": [{"id": call_id, "function": {"name": name, "arguments": json.dumps(args)}}],
+    }
+
+
+def _other_tasks():
+    return asyncio.all_tasks() - {asyncio.current_task()}
+
+@pytest.mark.asyncio
+async def test_run_yields_tool_steps_then_response():
+    """A tool call is executed, its result fed back to the model, then the final answer is yielded."""
+    router = _StubRouter(_tool_call("markx_search", {"query": "news"}), {"content": "All done"})
+    agent = ReActAgent(router=router)
+    agent._dispatch_tool = AsyncMock(return_value="headlines")
+    
+    steps = [step async for step in agent.run("What's new?")]
+    
+    assert [s.type for s in steps] == [StepType.TOOL_CALL, StepType.OBSERVATION, StepType.RESPONSE]
+    assert steps[1].tool_result == "headlines"
+    assert steps[2].content == "All done"
+    assert router.calls[1][-1] == {"role": "tool", "tool_call_id": "call-1", "content": "headlines"}
+    assert not _other_tasks()
+
+@pytest.mark.asyncio
+async def test_run_consumer_stopping_early_leaks_no_tasks():
+    """Closing the stream while the step queue is full cancels and reaps the producer."""
+    agent = ReActAgent(router=_StubRouter(_tool_call("markx_search", {"query": "loop"})), max_steps=1000)
+    agent._dispatch_tool = AsyncMock(return_value="again")
+    
+    stream = agent.run("Loop forever")
+    await stream.__anext__()
+    await asyncio.sleep(0.05)  # let the producer fill the bounded queue
+    await asyncio.wait_for(stream.aclose(), timeout=1)
+    
+    assert not _other_tasks()
+
+@pytest.mark.asyncio
+async def test_run_surfaces_producer_exception():
+    """An exception inside the loop reaches the caller once the steps before it are consumed."""
+    class _FailingRouter:
+        async def chat(self, messages, tools=None):
+            raise RuntimeError("provider exploded")
+    
+    agent = ReActAgent(router=_FailingRouter())
+    
+    with pytest.raises(RuntimeError, match="provider exploded"):
+        async for _ in agent.run("Hello"):
+            pass
+    assert not _other_tasks()
+
+@pytest.mark.asyncio
+async def test_tool_timeout_becomes_observation():
+    """A tool exceeding its timeout yields an error step and a timeout observation for the model."""
+    router = _StubRouter(_tool_call("markx_search", {"query": "slow"}), {"content": "Gave up"})
+    agent = ReActAgent(router=router)
+    agent._tool_timeouts["markx_search"] = 0.05
+    
+    async def _slow_dispatch(tool_name, args):
+        await asyncio.sleep(10)
+    agent._dispatch_tool = _slow_dispatch
+    
+    steps = [step async for step in agent.run("Search slowly")]
+    
+    assert [s.type for s in steps] == [StepType.TOOL_CALL, StepType.ERROR, StepType.OBSERVATION, StepType.RESPONSE]
+    assert steps[2].tool_result == "Tool timed out after 0.05s"
+    assert router.calls[1][-1]["content"] == "Tool timed out after 0.05s"
+
+@pytest.mark.asyncio
+async def test_invalid_args_rejected_before_dispatch():
+    """Static tools validate their arguments; tools shadowed by a system definition use its schema instead."""
+    pytest.importorskip("fastjsonschema")
+    agent = ReActAgent(router=_StubRouter({"content": ""}))
+    agent._dispatch_tool = AsyncMock(return_value="ok")
+    
+    result = await agent.execute_tool("open_url", {"link": "example.com"})
+    assert result.startswith("Invalid args for open_url")
+    agent._dispatch_tool.assert_not_awaited()
+    
+    # SystemTools.open_application takes app_name, not the static schema's name
+    assert await agent.execute_tool("open_application", {"app_name": "chrome"}) == "ok"
+    agent._dispatch_tool.assert_awaited_once_with("open_application", {"app_name": "chrome"})
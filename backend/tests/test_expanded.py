@@ -2,6 +2,7 @@
 import pytest
 import sys
 import os
+import json
 from unittest.mock import MagicMock, patch, AsyncMock
 
 # Add backend to path
@@ -14,12 +15,12 @@ async def test_aircraft_report_opensky():
     # Mock httpx client response
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {
+    mock_response.content = json.dumps({
         "states": [
             ["abc", "CALLSIGN1", "US", 0, 0, 0, 0, 0, False, 0, 0, 0, 0, 0, 0, False, 0],
             ["def", "CALLSIGN2", "US", 0, 0, 0, 0, 0, False, 0, 0, 0, 0, 0, 0, False, 0]
         ]
-    }
+    }).encode()
     
     with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
         mock_get.return_value = mock_response
@@ -47,3 +48,22 @@ async def test_messaging_platforms():
         await markx_actions.send_message("Chan", "Hi", "Discord")
         # Just verifying it calls the automation thread
         mock_thread.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_web_search_serpapi():
+    # Mock SerpApi JSON response
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "organic_results": [
+            {"snippet": "Cats are small."},
+            {"snippet": "Cats purr."},
+            {"snippet": "Ignored."}
+        ]
+    }
+    
+    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = mock_response
+        result = await markx_actions.markx_web_search("cats", api_key="key")
+        assert result == "Cats are small. Cats purr."
+        assert mock_get.call_args.kwargs["params"]["api_key"] == "key"
@@ -2,7 +2,7 @@
 import pytest
 import sys
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, patch, AsyncMock
 
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,12 +12,24 @@ from tools import markx_actions
 @pytest.mark.asyncio
 async def test_weather_report_structure():
     with patch('webbrowser.open') as mock_open:
-        result = await markx_actions.weather_report("New York", "today")
+        result = await markx_actions.weather_report("New York", "today", open_browser=True)
         assert "Opened weather report" in result
         mock_open.assert_called_once()
         args, _ = mock_open.call_args
         assert "New+York" in args[0]
 
+@pytest.mark.asyncio
+async def test_weather_report_skips_browser_by_default():
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.text = "New York: Sunny 25C"
+    
+    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get, patch('webbrowser.open') as mock_open:
+        mock_get.return_value = mock_response
+        result = await markx_actions.weather_report("New York")
+        assert "Sunny 25C" in result
+        mock_open.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_send_message_missing_library():
     # If pyautogui is missing, it should handle gracefully
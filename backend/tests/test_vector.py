@@ -48,3 +48,100 @@ def test_persistence(vector_service):
     vector_service.add_memory("The sky is blue today.")
     count = vector_service.count()
     assert count == 1
+
+
+# --- Collection migration, with stub embedders instead of the MiniLM model ---
+
+import chromadb
+from chromadb import EmbeddingFunction
+from chromadb.utils.embedding_functions import register_embedding_function
+
+import services.vector_memory as vector_memory
+
+
+class _StubEmbedder(EmbeddingFunction):
+    """Deterministic 8-dim vectors; the scale tells the two stubs' vectors apart"""
+    SCALE = 1.0
+
+    def __init__(self):
+        pass
+
+    def __call__(self, input):
+        return [[self.SCALE * (len(text) + i) for i in range(8)] for text in input]
+
+    @classmethod
+    def name(cls):
+        return cls.NAME
+
+    @classmethod
+    def build_from_config(cls, config):
+        return cls()
+
+    def get_config(self):
+        return {}
+
+
+@register_embedding_function
+class _CurrentEmbedder(_StubEmbedder):
+    NAME = "test_current_embedder"
+
+
+@register_embedding_function
+class _OldEmbedder(_StubEmbedder):
+    NAME = "test_old_embedder"
+    SCALE = 2.0
+
+
+@pytest.fixture
+def stub_embedder():
+    with patch.object(vector_memory, "_get_embedder", return_value=_CurrentEmbedder()):
+        yield
+
+
+def _old_collection(path, name=vector_memory.COLLECTION_NAME):
+    collection = chromadb.PersistentClient(path=str(path)).create_collection(
+        name=name, embedding_function=_OldEmbedder(), metadata=vector_memory.HNSW_METADATA
+    )
+    collection.add(ids=["a", "b"], documents=["first memory", "second"], metadatas=[{"category": "x"}, {"category": "y"}])
+    return collection
+
+
+def test_migrates_collection_from_other_embedder(tmp_path, stub_embedder):
+    """A collection persisted with another embedder is re-embedded rather than failing to open."""
+    _old_collection(tmp_path)
+
+    service = VectorMemoryService(persist_path=str(tmp_path))
+
+    assert service.collection.configuration_json["embedding_function"]["name"] == _CurrentEmbedder.NAME
+    stored = service.collection.get(include=["documents", "metadatas", "embeddings"])
+    assert dict(zip(stored["ids"], stored["documents"])) == {"a": "first memory", "b": "second"}
+    assert {m["category"] for m in stored["metadatas"]} == {"x", "y"}
+    # Re-embedded with the current embedder
+    assert stored["embeddings"][stored["ids"].index("b")].tolist() == pytest.approx(_CurrentEmbedder()(["second"])[0].tolist())
+    assert [c.name for c in service.client.list_collections()] == [vector_memory.COLLECTION_NAME]
+    assert service.search_memory("second")[0]["content"] == "second"
+
+
+def test_migration_reuses_minilm_vectors(tmp_path, stub_embedder):
+    """Vectors from another MiniLM embedder are copied instead of recomputed."""
+    _old_collection(tmp_path)
+
+    with patch.object(vector_memory, "_is_minilm_embedder", return_value=True):
+        service = VectorMemoryService(persist_path=str(tmp_path))
+
+    stored = service.collection.get(ids=["b"], include=["embeddings"])
+    assert stored["embeddings"][0].tolist() == pytest.approx(_OldEmbedder()(["second"])[0].tolist())
+
+
+def test_resumes_interrupted_migration(tmp_path, stub_embedder):
+    """A copy left under the staging name (old collection already dropped) takes over the real name."""
+    client = chromadb.PersistentClient(path=str(tmp_path))
+    staged = client.create_collection(
+        name=f"{vector_memory.COLLECTION_NAME}_migrating", embedding_function=_CurrentEmbedder()
+    )
+    staged.add(ids=["a"], documents=["kept"])
+
+    service = VectorMemoryService(persist_path=str(tmp_path))
+
+    assert service.count() == 1
+    assert [c.name for c in service.client.list_collections()] == [vector_memory.COLLECTION_NAME]
@@ -7,6 +7,7 @@ import subprocess
 import webbrowser
 import platform
 import asyncio
+import contextlib
 from datetime import datetime
 from typing import Optional
 import aiofiles
@@ -43,6 +44,55 @@ WINDOWS_APPS = {
     "steam": "steam",
 }
 
+# Substrings that get a shell command rejected
+_DANGEROUS_COMMANDS = ('rm -rf', 'del /f /s', 'format', 'mkfs', ':(){', 'fork bomb')
+
+# Max characters returned by read_file
+MAX_READ_CHARS = 10000
+
+# System directories that file tools may not touch
+_BLOCKED_PATHS = ('C:\\Windows', 'C:\\Program Files', '/etc', '/bin', '/usr')
+
+
+# Background CPU sampler shared by every ComputerControl instance
+CPU_SAMPLE_INTERVAL_S = 2.0
+_cpu_last: Optional[float] = None
+_cpu_sampler: Optional[asyncio.Task] = None
+_cpu_sampler_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _sample_cpu(psutil):
+    """Refresh the cached CPU reading; interval=None is a non-blocking delta since the last call"""
+    global _cpu_last
+    while True:
+        await asyncio.sleep(CPU_SAMPLE_INTERVAL_S)
+        _cpu_last = psutil.cpu_percent(interval=None)
+
+
+async def _cpu_percent(psutil) -> float:
+    """Latest CPU usage, starting the sampler on first use (and after an event loop restart)"""
+    global _cpu_last, _cpu_sampler, _cpu_sampler_loop
+    loop = asyncio.get_running_loop()
+    # A sampler left on a closed loop never finishes, so the loop is compared too
+    if _cpu_sampler is None or _cpu_sampler.done() or _cpu_sampler_loop is not loop:
+        _cpu_sampler = loop.create_task(_sample_cpu(psutil))
+        _cpu_sampler_loop = loop
+    if _cpu_last is None:
+        # First reading needs a real measurement window
+        _cpu_last = await asyncio.to_thread(psutil.cpu_percent, interval=1)
+    return _cpu_last
+
+
+async def close_cpu_sampler():
+    """Cancel the background CPU sampler (called on app shutdown)."""
+    global _cpu_sampler, _cpu_sampler_loop
+    if _cpu_sampler is not None and _cpu_sampler_loop is asyncio.get_running_loop():
+        _cpu_sampler.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _cpu_sampler
+    _cpu_sampler = None
+    _cpu_sampler_loop = None
+
 
 class ComputerControl:
     """Tools for controlling the computer"""
@@ -116,8 +166,8 @@ class ComputerControl:
         """Execute a shell command and return output"""
         try:
             # Security: Block dangerous commands
-            dangerous = ['rm -rf', 'del /f /s', 'format', 'mkfs', ':(){', 'fork bomb']
-            if any(d in command.lower() for d in dangerous):
+            command_lower = command.lower()
+            if any(d in command_lower for d in _DANGEROUS_COMMANDS):
                 return "Error: Command blocked for security reasons"
             
             process = await asyncio.create_subprocess_shell(
@@ -143,16 +193,16 @@ class ComputerControl:
             file_path = os.path.expanduser(file_path)
             
             # Block access to system directories
-            blocked_paths = ['C:\\Windows', 'C:\\Program Files', '/etc', '/bin', '/usr']
-            if any(file_path.startswith(p) for p in blocked_paths):
+            if file_path.startswith(_BLOCKED_PATHS):
                 return "Error: Access to system directories is restricted"
             
+            # Read at most one character past the limit to detect truncation
             async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                content = await f.read()
+                content = await f.read(MAX_READ_CHARS + 1)
             
             # Limit content length
-            if len(content) > 10000:
-                content = content[:10000] + "\n... (truncated)"
+            if len(content) > MAX_READ_CHARS:
+                content = content[:MAX_READ_CHARS] + "\n... (truncated)"
             
             return content
             
@@ -167,8 +217,7 @@ class ComputerControl:
             file_path = os.path.expanduser(file_path)
             
             # Block access to system directories
-            blocked_paths = ['C:\\Windows', 'C:\\Program Files', '/etc', '/bin', '/usr']
-            if any(file_path.startswith(p) for p in blocked_paths):
+            if file_path.startswith(_BLOCKED_PATHS):
                 return False
             
             # Create directory if needed
@@ -195,7 +244,7 @@ class ComputerControl:
             elif info_type == "battery":
                 try:
                     import psutil
-                    battery = psutil.sensors_battery()
+                    battery = await asyncio.to_thread(psutil.sensors_battery)
                     if battery:
                         status = "charging" if battery.power_plugged else "on battery"
                         return f"Battery is at {battery.percent}%, {status}"
@@ -206,7 +255,7 @@ class ComputerControl:
             elif info_type == "memory":
                 try:
                     import psutil
-                    mem = psutil.virtual_memory()
+                    mem = await asyncio.to_thread(psutil.virtual_memory)
                     return f"Memory usage: {mem.percent}% ({mem.used // (1024**3)}GB / {mem.total // (1024**3)}GB)"
                 except ImportError:
                     return "Memory information unavailable"
@@ -214,15 +263,16 @@ class ComputerControl:
             elif info_type == "cpu":
                 try:
                     import psutil
-                    cpu = psutil.cpu_percent(interval=1)
+                    cpu = await _cpu_percent(psutil)
                     return f"CPU usage: {cpu}%"
                 except ImportError:
                     return "CPU information unavailable"
                     
             elif info_type == "all":
-                results = []
-                for t in ["time", "date", "battery", "memory", "cpu"]:
-                    results.append(await self.get_system_info(t))
+                # The 1s CPU sample dominates; run the rest alongside it
+                results = await asyncio.gather(
+                    *(self.get_system_info(t) for t in ("time", "date", "battery", "memory", "cpu"))
+                )
                 return "\n".join(results)
                 
             return f"Unknown info type: {info_type}"
@@ -24,6 +24,7 @@ class DynamicTooler:
             open(os.path.join(self.tools_dir, "__init__.py"), 'w').close()
             
         self.loaded_tools = {} # name -> module
+        self._mtimes = {} # name -> (mtime_ns, size) of the file last executed
         self.convert_legacy_tools()
         self.refresh_tools()
 
@@ -32,26 +33,50 @@ class DynamicTooler:
         pass
 
     def refresh_tools(self):
-        """Scan directory and reload all tools"""
-        self.loaded_tools = {}
+        """Scan directory and (re)load tools whose files are new or changed since the last scan"""
         if not os.path.exists(self.tools_dir):
+            self.loaded_tools = {}
+            self._mtimes = {}
             return
 
-        for filename in os.listdir(self.tools_dir):
-            if filename.endswith(".py") and filename != "__init__.py":
-                module_name = filename[:-3]
+        seen = set()
+        with os.scandir(self.tools_dir) as it:
+            for entry in it:
+                if not (entry.name.endswith(".py") and entry.name != "__init__.py" and entry.is_file()):
+                    continue
+                module_name = entry.name[:-3]
                 try:
-                    filepath = os.path.join(self.tools_dir, filename)
-                    spec = importlib.util.spec_from_file_location(module_name, filepath)
-                    if spec and spec.loader:
-                        module = importlib.util.module_from_spec(spec)
-                        sys.modules[module_name] = module
-                        spec.loader.exec_module(module)
-                        
-                        if hasattr(module, 'TOOL_DEFINITION') and hasattr(module, 'execute'):
-                            self.loaded_tools[module_name] = module
-                except Exception as e:
-                    print(f"Failed to load custom tool {filename}: {e}")
+                    st = entry.stat()
+                except OSError:
+                    continue
+                seen.add(module_name)
+                
+                version = (st.st_mtime_ns, st.st_size)
+                if self._mtimes.get(module_name) == version:
+                    continue
+                self._mtimes[module_name] = version
+                self.loaded_tools.pop(module_name, None)
+                self._load_tool(module_name, entry.path)
+
+        # Forget tools whose files were deleted
+        for module_name in list(self._mtimes):
+            if module_name not in seen:
+                del self._mtimes[module_name]
+                self.loaded_tools.pop(module_name, None)
+
+    def _load_tool(self, module_name: str, filepath: str):
+        """Execute a custom tool file and register it if it follows the convention"""
+        try:
+            spec = importlib.util.spec_from_file_location(module_name, filepath)
+            if spec and spec.loader:
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
+                
+                if hasattr(module, 'TOOL_DEFINITION') and hasattr(module, 'execute'):
+                    self.loaded_tools[module_name] = module
+        except Exception as e:
+            print(f"Failed to load custom tool {os.path.basename(filepath)}: {e}")
 
     def create_tool(self, name: str, python_code: str, description: str) -> str:
         """
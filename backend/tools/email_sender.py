@@ -1,4 +1,7 @@
+import mmap
 import smtplib
+import threading
+from collections import OrderedDict
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
@@ -6,6 +9,76 @@ import os
 from pathlib import Path
 from typing import List, Optional
 
+# Reconnect after this many messages on one SMTP session
+MAX_MESSAGES_PER_CONNECTION = 100
+
+# Encoded attachment parts reused across sends, keyed by (path, mtime, size).
+# Bounded by encoded size; files above the per-file limit are encoded per send and not kept.
+ATTACHMENT_CACHE_BYTES = 16 * 1024 * 1024
+ATTACHMENT_CACHE_MAX_FILE = 2 * 1024 * 1024
+_attachment_cache: "OrderedDict[tuple, MIMEApplication]" = OrderedDict()
+_attachment_cache_bytes = 0
+_attachment_lock = threading.Lock()
+
+def _attachment_part(fpath: str) -> MIMEApplication:
+    """Return the MIME part for a file, encoding it only when it changed since the last send."""
+    global _attachment_cache_bytes
+    path = Path(fpath)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(fpath) from None
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+
+    with _attachment_lock:
+        part = _attachment_cache.get(key)
+        if part is not None:
+            _attachment_cache.move_to_end(key)
+            return part
+
+    with open(path, "rb") as f:
+        if st.st_size:
+            # Encode straight from the mapping instead of reading the file into memory first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                part = MIMEApplication(mm, Name=path.name)
+        else:
+            part = MIMEApplication(b"", Name=path.name)
+    part['Content-Disposition'] = f'attachment; filename="{path.name}"'
+
+    if st.st_size > ATTACHMENT_CACHE_MAX_FILE:
+        return part
+
+    with _attachment_lock:
+        if key not in _attachment_cache:
+            _attachment_cache[key] = part
+            _attachment_cache_bytes += len(part.get_payload())
+        while _attachment_cache_bytes > ATTACHMENT_CACHE_BYTES:
+            _, evicted = _attachment_cache.popitem(last=False)
+            _attachment_cache_bytes -= len(evicted.get_payload())
+    return part
+
+def _build_message(sender: str,
+                   to_email: str,
+                   subject: str,
+                   body: str,
+                   html: bool = False,
+                   attachments: Optional[List[str]] = None) -> MIMEMultipart:
+    """Build the MIME message; raises FileNotFoundError for a missing attachment."""
+    msg = MIMEMultipart()
+    msg['From'] = sender
+    msg['To'] = to_email
+    msg['Subject'] = subject
+
+    # Attach body
+    msg.attach(MIMEText(body, 'html' if html else 'plain'))
+
+    # Attach files
+    if attachments:
+        for fpath in attachments:
+            msg.attach(_attachment_part(fpath))
+
+    return msg
+
 class EmailSender:
     def __init__(self):
         self.host = os.getenv("SMTP_HOST", "smtp.gmail.com")
@@ -18,6 +91,48 @@ class EmailSender:
             # but for now we'll stick to env vars as primary for security.
             pass
 
+        # Persistent SMTP session reused across sends
+        self._conn: Optional[smtplib.SMTP] = None
+        self._sent_on_conn = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _ensure_connection(self) -> smtplib.SMTP:
+        """Return a logged-in SMTP session, reconnecting if it is dead or has hit its message cap."""
+        if self._conn is not None and self._sent_on_conn < MAX_MESSAGES_PER_CONNECTION:
+            try:
+                if self._conn.noop()[0] == 250:
+                    return self._conn
+            except (smtplib.SMTPException, OSError):
+                pass
+
+        self.close()
+        conn = smtplib.SMTP(self.host, self.port)
+        try:
+            conn.starttls()
+            conn.login(self.user, self.password)
+        except Exception:
+            conn.close()
+            raise
+        self._conn = conn
+        self._sent_on_conn = 0
+        return conn
+
+    def close(self):
+        """Close the SMTP session, if any."""
+        if self._conn is not None:
+            try:
+                self._conn.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._conn = None
+            self._sent_on_conn = 0
+
     def send_email(self, 
                    to_email: str, 
                    subject: str, 
@@ -28,37 +143,31 @@ class EmailSender:
         if not self.user or not self.password:
             return "Error: SMTP credentials not configured. Set SMTP_USER and SMTP_PASSWORD environment variables."
 
-        msg = MIMEMultipart()
-        msg['From'] = self.user
-        msg['To'] = to_email
-        msg['Subject'] = subject
-
-        # Attach body
-        msg.attach(MIMEText(body, 'html' if html else 'plain'))
-
-        # Attach files
-        if attachments:
-            for fpath in attachments:
-                path = Path(fpath)
-                if path.exists():
-                    with open(path, "rb") as f:
-                        part = MIMEApplication(f.read(), Name=path.name)
-                    part['Content-Disposition'] = f'attachment; filename="{path.name}"'
-                    msg.attach(part)
-                else:
-                    return f"Error: Attachment not found: {fpath}"
+        try:
+            msg = _build_message(self.user, to_email, subject, body, html, attachments)
+        except FileNotFoundError as e:
+            return f"Error: Attachment not found: {e}"
 
         try:
-            with smtplib.SMTP(self.host, self.port) as server:
-                server.starttls()
-                server.login(self.user, self.password)
-                server.send_message(msg)
+            with self._lock:
+                try:
+                    self._ensure_connection().send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # Server dropped the session between the liveness check and the send
+                    self.close()
+                    self._ensure_connection().send_message(msg)
+                self._sent_on_conn += 1
             return f"Email successfully sent to {to_email}"
         except Exception as e:
             return f"Failed to send email: {str(e)}"
 
+# Shared sender so consecutive tool calls reuse one SMTP session
+_sender: Optional[EmailSender] = None
+
 def send_email_tool(to: str, subject: str, body: str, html: bool = False, attachments: str = None) -> str:
     """Send an email via SMTP."""
-    sender = EmailSender()
+    global _sender
+    if _sender is None:
+        _sender = EmailSender()
     attach_list = attachments.split(",") if attachments else None
-    return sender.send_email(to, subject, body, html, attach_list)
+    return _sender.send_email(to, subject, body, html, attach_list)
@@ -0,0 +1,104 @@
+import asyncio
+import os
+from email.mime.multipart import MIMEMultipart
+from typing import List, Optional
+
+try:
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
+
+from tools.email_sender import _build_message, send_email_tool
+
+# Number of SMTP sessions kept open for concurrent sends
+POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+
+class AsyncEmailPool:
+    """Up to `size` persistent aiosmtplib sessions, opened on demand and reused while idle."""
+
+    def __init__(self, size: int = POOL_SIZE):
+        self.host = os.getenv("SMTP_HOST", "smtp.gmail.com")
+        self.port = int(os.getenv("SMTP_PORT", "587"))
+        self.user = os.getenv("SMTP_USER")
+        self.password = os.getenv("SMTP_PASSWORD")
+        self.size = max(1, size)
+        self.clients: List["aiosmtplib.SMTP"] = []
+        self._idle: List["aiosmtplib.SMTP"] = []
+        # One slot per session; a send holds its slot until the session is idle again
+        self._slots = asyncio.Semaphore(self.size)
+
+    async def _open_client(self) -> "aiosmtplib.SMTP":
+        client = aiosmtplib.SMTP(hostname=self.host, port=self.port, start_tls=True)
+        await client.connect()
+        try:
+            await client.login(self.user, self.password)
+        except BaseException:
+            client.close()
+            raise
+        self.clients.append(client)
+        return client
+
+    def _discard(self, client: "aiosmtplib.SMTP"):
+        self.clients.remove(client)
+        client.close()
+
+    async def send(self, msg: MIMEMultipart):
+        """Send on an idle session (opening one only when none is free), reconnecting once if the server dropped it."""
+        async with self._slots:
+            client = self._idle.pop() if self._idle else await self._open_client()
+            try:
+                try:
+                    await client.send_message(msg)
+                except aiosmtplib.SMTPServerDisconnected:
+                    self._discard(client)
+                    client = None
+                    client = await self._open_client()
+                    await client.send_message(msg)
+            finally:
+                if client is not None:
+                    self._idle.append(client)
+
+    async def close(self):
+        """Quit every session."""
+        for client in self.clients:
+            try:
+                await client.quit()
+            except (aiosmtplib.SMTPException, OSError):
+                pass
+        self.clients = []
+        self._idle = []
+
+_pool: Optional[AsyncEmailPool] = None
+
+async def send_email_tool_async(to: str, subject: str, body: str, html: bool = False, attachments: str = None, pool: Optional[AsyncEmailPool] = None) -> str:
+    """Send an email over the shared async SMTP pool."""
+    global _pool
+    if aiosmtplib is None:
+        # No async SMTP client available; use the pooled blocking sender off the loop
+        return await asyncio.to_thread(send_email_tool, to, subject, body, html, attachments)
+
+    if pool is None:
+        if _pool is None:
+            _pool = AsyncEmailPool()
+        pool = _pool
+    if not pool.user or not pool.password:
+        return "Error: SMTP credentials not configured. Set SMTP_USER and SMTP_PASSWORD environment variables."
+
+    attach_list = attachments.split(",") if attachments else None
+    try:
+        msg = _build_message(pool.user, to, subject, body, html, attach_list)
+    except FileNotFoundError as e:
+        return f"Error: Attachment not found: {e}"
+
+    try:
+        await pool.send(msg)
+        return f"Email successfully sent to {to}"
+    except Exception as e:
+        return f"Failed to send email: {str(e)}"
+
+async def close_email_pool():
+    """Quit the shared pool's sessions (app shutdown)."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
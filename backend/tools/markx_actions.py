@@ -5,27 +5,95 @@ Tools ported from Mark-X repository for desktop automation and information retri
 Now includes Real Jarvis features: Aircraft Tracking, Smart Weather, and Universal Messaging.
 """
 import time
+import json
 import asyncio
+import itertools
 import webbrowser
 import logging
 import urllib.parse
 import httpx
 from typing import Optional, List, Dict
 
+from tools.results import ToolFailure
+
 # Conditional import for pyautogui to avoid issues in headless environments
 try:
     import pyautogui
 except ImportError:
     pyautogui = None
 
-# Conditional import for serpapi
+# orjson decodes large API payloads (OpenSky) several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Window polling for send_message; PyGetWindow only supports Windows/macOS
+try:
+    import pygetwindow
+except (ImportError, NotImplementedError):
+    pygetwindow = None
+
+# h2 enables HTTP/2 on the shared client when available
 try:
-    from serpapi import GoogleSearch
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
 except ImportError:
-    GoogleSearch = None
+    HTTP2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Per-service request timeouts (seconds)
+TIMEOUTS = {
+    "default": 10.0,
+    "wttr": 10.0,
+    "opensky": 10.0,
+    "serpapi": 15.0,
+}
+
+SERPAPI_URL = "https://serpapi.com/search.json"
+
+_http: Optional[httpx.AsyncClient] = None
+_http_loop: Optional[asyncio.AbstractEventLoop] = None
+
+async def _get_http() -> httpx.AsyncClient:
+    """Return the shared keep-alive client, rebuilding it if its event loop has changed."""
+    global _http, _http_loop
+    loop = asyncio.get_running_loop()
+    if _http is None or _http.is_closed or _http_loop is not loop:
+        _http = httpx.AsyncClient(
+            timeout=httpx.Timeout(TIMEOUTS["default"]),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=HTTP2_AVAILABLE,
+        )
+        _http_loop = loop
+    return _http
+
+async def close_http():
+    """Close the shared HTTP client (called on app shutdown)."""
+    global _http, _http_loop
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+        _http_loop = None
+
+def _wait_window(title: str, timeout: float = 5.0, fallback: float = 2.0) -> bool:
+    """Poll until the active window title contains `title`; sleeps `fallback` when polling is unavailable."""
+    if pygetwindow is None:
+        time.sleep(fallback)
+        return False
+    deadline = time.perf_counter() + timeout
+    title = title.lower()
+    while time.perf_counter() < deadline:
+        try:
+            window = pygetwindow.getActiveWindow()
+        except Exception:
+            window = None
+        if window is not None and title in (window.title or "").lower():
+            return True
+        time.sleep(0.05)
+    return False
+
 async def send_message(receiver: str, message_text: str, platform: str = "WhatsApp") -> str:
     """
     Send a message via Windows desktop application (WhatsApp, Telegram, Discord, Slack).
@@ -62,7 +130,7 @@ async def send_message(receiver: str, message_text: str, platform: str = "WhatsA
             # Type platform name
             pyautogui.write(platform, interval=0.03)
             pyautogui.press("enter")
-            time.sleep(2.0) # Wait for app to open
+            _wait_window(platform) # Wait for app to open
 
             # Search for contact/channel
             pyautogui.hotkey(*search_shortcut)
@@ -70,6 +138,7 @@ async def send_message(receiver: str, message_text: str, platform: str = "WhatsA
             
             # Type receiver name
             pyautogui.write(receiver, interval=0.03)
+            # Nothing confirms the results are ready, and enter picks whichever chat is highlighted
             time.sleep(1.0) # Wait for search results
             pyautogui.press("enter") # Select contact
             time.sleep(0.5)
@@ -83,38 +152,45 @@ async def send_message(receiver: str, message_text: str, platform: str = "WhatsA
 
     except Exception as e:
         logger.error(f"Error executing send_message: {e}")
-        return f"Failed to send message: {e}"
+        return ToolFailure(f"Failed to send message: {e}")
 
-async def weather_report(city: str, time_query: str = "today") -> str:
+async def weather_report(city: str, time_query: str = "today", open_browser: bool = False) -> str:
     """
-    Get a smart weather report using wttr.in API (text based) and open browser as backup.
+    Get a smart weather report using wttr.in API (text based), optionally opening the browser too.
     
     Args:
         city: City name
         time_query: 'today', 'tomorrow' (used for browser only, wttr.in gives current/3day)
+        open_browser: Also open the forecast in the browser (off by default; the text summary is usually enough)
         
     Returns:
         Spoken summary of the weather.
     """
     try:
-        # Fetch text report from wttr.in (format j1 for JSON, or format 3 for one-line)
-        # Using format 3: "City: Condition Temp"
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(f"https://wttr.in/{city}?format=3")
-            if resp.status_code == 200:
-                weather_summary = resp.text.strip()
-            else:
-                weather_summary = f"I couldn't fetch the data directly."
-
-        # Also open in browser for visual
-        query = f"weather in {city} {time_query}"
-        encoded_query = urllib.parse.quote_plus(query)
-        url = f"https://www.google.com/search?q={encoded_query}"
-        webbrowser.open(url)
+        browser_task = None
+        if open_browser:
+            # Browser view of the forecast, opened while the wttr.in request is in flight
+            query = f"weather in {city} {time_query}"
+            encoded_query = urllib.parse.quote_plus(query)
+            url = f"https://www.google.com/search?q={encoded_query}"
+            browser_task = asyncio.create_task(asyncio.to_thread(webbrowser.open, url))
+        try:
+            # Fetch text report from wttr.in (format j1 for JSON, or format 3 for one-line)
+            # Using format 3: "City: Condition Temp"
+            client = await _get_http()
+            resp = await client.get(f"https://wttr.in/{city}?format=3", timeout=TIMEOUTS["wttr"])
+            if resp.status_code != 200:
+                return ToolFailure(f"Weather report for {city}: I couldn't fetch the data directly.")
+            weather_summary = resp.text.strip()
+        finally:
+            if browser_task is not None:
+                await browser_task
         
-        return f"Weather report for {city}: {weather_summary}. I've also opened the forecast in your browser."
+        if open_browser:
+            return f"Weather report for {city}: {weather_summary}. I've also opened the forecast in your browser."
+        return f"Weather report for {city}: {weather_summary}."
     except Exception as e:
-        return f"Failed to get weather report: {e}"
+        return ToolFailure(f"Failed to get weather report: {e}")
 
 async def aircraft_report(radius_km: int = 50) -> str:
     """
@@ -139,41 +215,47 @@ async def aircraft_report(radius_km: int = 50) -> str:
     # Note: OpenSky 'all' endpoint is heavy.
     
     try:
-        async with httpx.AsyncClient() as client:
-            # Using a sample bounding box for New York area for demo purposes
-            # lamin=40.5, lomin=-74.5, lamax=41.0, lomax=-73.5
-            params = {
-                "lamin": 40.0,
-                "lomin": -75.0,
-                "lamax": 42.0,
-                "lomax": -72.0
-            }
-            resp = await client.get("https://opensky-network.org/api/states/all", params=params, timeout=10.0)
+        client = await _get_http()
+        # Using a sample bounding box for New York area for demo purposes
+        # lamin=40.5, lomin=-74.5, lamax=41.0, lomax=-73.5
+        params = {
+            "lamin": 40.0,
+            "lomin": -75.0,
+            "lamax": 42.0,
+            "lomax": -72.0
+        }
+        resp = await client.get("https://opensky-network.org/api/states/all", params=params, timeout=TIMEOUTS["opensky"])
+        
+        if resp.status_code == 200:
+            data = orjson.loads(resp.content) if orjson else json.loads(resp.content)
+            states = data.get("states") or []
+            if not states:
+                return "No aircraft detected in the standard patrol area (NY Region) right now."
+            
+            count = len(states)
+            
+            # Get up to 3 callsigns from the first few rows (callsign may be blank or null)
+            callsigns = []
+            for state in itertools.islice(states, 10):
+                callsign = (state[1] or "").strip()
+                if callsign:
+                    callsigns.append(callsign)
+                    if len(callsigns) == 3:
+                        break
+            planes_str = ", ".join(callsigns)
+            
+            return f"Radar checks confirm {count} aircraft in the sector. Identifying: {planes_str} and others."
+        else:
+            return ToolFailure("Radar systems (OpenSky API) are currently unreachable.")
             
-            if resp.status_code == 200:
-                data = resp.json()
-                states = data.get("states", [])
-                if not states:
-                    return "No aircraft detected in the standard patrol area (NY Region) right now."
-                
-                count = len(states)
-                
-                # Get first 3 callsigns
-                callsigns = [s[1].strip() for s in states[:3] if s[1].strip()]
-                planes_str = ", ".join(callsigns)
-                
-                return f"Radar checks confirm {count} aircraft in the sector. Identifying: {planes_str} and others."
-            else:
-                return "Radar systems (OpenSky API) are currently unreachable."
-                
     except Exception as e:
         logger.error(f"Aircraft report failed: {e}")
-        return "Sir, I'm unable to access the flight radar data at the moment."
+        return ToolFailure("Sir, I'm unable to access the flight radar data at the moment.")
 
 async def markx_web_search(query: str, api_key: str = None) -> str:
     """
     Perform a search using SerpApi and return a summarized answer (Mark-X style).
-    If SerpApi is not configured/installed, falls back to opening a browser.
+    If no SerpApi key is configured, falls back to opening a browser.
     
     Args:
         query: Search query
@@ -182,24 +264,21 @@ async def markx_web_search(query: str, api_key: str = None) -> str:
     Returns:
         Summarized answer string
     """
-    if GoogleSearch and api_key:
+    if api_key:
         try:
-            return await asyncio.to_thread(_serpapi_search, query, api_key)
+            return await _serpapi_search(query, api_key)
         except Exception as e:
             logger.error(f"SerpApi failed: {e}")
-            return f"Search failed: {e}"
+            return ToolFailure(f"Search failed: {e}")
     else:
         # Fallback to standard browser open
         encoded_query = urllib.parse.quote_plus(query)
         url = f"https://www.google.com/search?q={encoded_query}"
-        webbrowser.open(url)
-        if not GoogleSearch:
-            return "Opened search results in browser (SerpApi not installed)."
-        else:
-            return "Opened search results in browser (API Key missing)."
+        await asyncio.to_thread(webbrowser.open, url)
+        return "Opened search results in browser (API Key missing)."
 
-def _serpapi_search(query: str, api_key: str) -> str:
-    """Blocking SerpApi call"""
+async def _serpapi_search(query: str, api_key: str) -> str:
+    """SerpApi call over the shared HTTP client"""
     params = {
         "q": query,
         "engine": "google",
@@ -209,8 +288,10 @@ def _serpapi_search(query: str, api_key: str) -> str:
         "api_key": api_key
     }
     
-    search = GoogleSearch(params)
-    data = search.get_dict()
+    client = await _get_http()
+    resp = await client.get(SERPAPI_URL, params=params, timeout=TIMEOUTS["serpapi"])
+    resp.raise_for_status()
+    data = resp.json()
     
     organic = data.get("organic_results", [])
     if not organic:
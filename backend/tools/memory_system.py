@@ -1,10 +1,18 @@
+import mmap
 import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
+
+# Upper bound on threads used to scan notes in parallel
+SEARCH_WORKERS = 32
 
 class MemorySystem:
+    _inited_roots: set = set()
+
     def __init__(self, root_dir: str = "memory_store"):
         self.root = Path(root_dir)
         self.folders = {
@@ -15,8 +23,12 @@ class MemorySystem:
             "inbox": self.root / "inbox",
             "daily": self.root / "daily"
         }
-        for p in self.folders.values():
-            p.mkdir(parents=True, exist_ok=True)
+        # Folder creation only needs to happen once per root per process
+        root_key = self.root.resolve()
+        if root_key not in MemorySystem._inited_roots or not self.root.is_dir():
+            for p in self.folders.values():
+                p.mkdir(parents=True, exist_ok=True)
+            MemorySystem._inited_roots.add(root_key)
 
     def create_note(self, title: str, content: str, category: str = "inbox") -> str:
         """Create a new note in the specified category."""
@@ -26,9 +38,12 @@ class MemorySystem:
         filename = f"{title.lower().replace(' ', '_')}.md"
         path = self.folders[category] / filename
         
-        # Avoid overwrite unless intentional? For now, simplistic.
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(f"# {title}\n\n{content}")
+        # 'x' is O_CREAT|O_EXCL: refuse to clobber an existing note without a separate exists() check
+        try:
+            with open(path, 'x', encoding='utf-8') as f:
+                f.write(f"# {title}\n\n{content}")
+        except FileExistsError:
+            return f"Error: Note {filename} already exists in {category}"
             
         return f"Note created: {path}"
 
@@ -40,11 +55,14 @@ class MemorySystem:
         timestamp = datetime.now().strftime("%H:%M:%S")
         entry = f"\n\n## {timestamp}\n{content}"
         
-        mode = 'a' if path.exists() else 'w'
-        with open(path, mode, encoding='utf-8') as f:
-            if mode == 'w':
-                f.write(f"# Daily Log: {today}\n")
-            f.write(entry)
+        # One open call creates or appends; an empty file means we just created it
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            if os.fstat(fd).st_size == 0:
+                os.write(fd, f"# Daily Log: {today}\n".encode('utf-8'))
+            os.write(fd, entry.encode('utf-8'))
+        finally:
+            os.close(fd)
             
         return f"Logged to {today}.md"
 
@@ -62,25 +80,63 @@ class MemorySystem:
         shutil.move(str(src), str(dst))
         return f"Moved {filename} from {from_cat} to {to_cat}"
 
-    def search_notes(self, query: str) -> str:
-        """Simple text search across all notes."""
-        results = []
+    def _iter_notes(self) -> Iterator[Tuple[str, str]]:
+        """Yield (category, path) for every note, using one scandir per folder."""
         for cat, folder in self.folders.items():
-            for fpath in folder.glob("*.md"):
-                try:
-                    with open(fpath, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        if query.lower() in content.lower():
-                            results.append(f"[{cat.upper()}] {fpath.name}")
-                except Exception:
-                    continue
+            try:
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                            yield cat, entry.path
+            except FileNotFoundError:
+                continue
+
+    @staticmethod
+    def _note_matches(fpath: str, pattern: re.Pattern) -> bool:
+        """Search one note through an mmap so the file is never copied into a str."""
+        try:
+            with open(fpath, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if isinstance(pattern.pattern, bytes):
+                        return pattern.search(mm) is not None
+                    # Non-ASCII queries need Unicode case folding, so decode
+                    return pattern.search(mm[:].decode('utf-8', errors='ignore')) is not None
+        except Exception:
+            return False
+
+    def search_notes(self, query: str) -> str:
+        """Case-insensitive text search across all notes."""
+        # Byte-level IGNORECASE only folds ASCII; fall back to a str pattern otherwise
+        if query.isascii():
+            pattern = re.compile(re.escape(query.encode()), re.IGNORECASE)
+        else:
+            pattern = re.compile(re.escape(query), re.IGNORECASE)
+
+        notes = list(self._iter_notes())
+        if not notes:
+            return "No matches found."
+
+        with ThreadPoolExecutor(max_workers=min(SEARCH_WORKERS, len(notes))) as pool:
+            hits = pool.map(lambda note: self._note_matches(note[1], pattern), notes)
+            results = [f"[{cat.upper()}] {os.path.basename(fpath)}" for (cat, fpath), hit in zip(notes, hits) if hit]
         
         if not results:
             return "No matches found."
         return "\n".join(results)
 
+_mem_cache: Dict[str, MemorySystem] = {}
+
+def _get_memory(root_dir: str = "memory_store") -> MemorySystem:
+    """Return the shared MemorySystem for root_dir, creating it on first use."""
+    mem = _mem_cache.get(root_dir)
+    if mem is None:
+        mem = _mem_cache[root_dir] = MemorySystem(root_dir)
+    return mem
+
 def run_memory_tool(action: str, **kwargs) -> str:
-    mem = MemorySystem()
+    mem = _get_memory(kwargs.get('root_dir', "memory_store"))
     if action == "create":
         return mem.create_note(kwargs['title'], kwargs['content'], kwargs.get('category', 'inbox'))
     elif action == "log":
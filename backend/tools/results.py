@@ -0,0 +1,11 @@
+"""
+Tool Results
+Types shared by the tools and the agent that runs them
+"""
+
+
+class ToolFailure(str):
+    """
+    Text a tool returns when it could not do its job.
+    Reads like any other result, but tells the agent not to reuse it.
+    """
@@ -1,16 +1,29 @@
-from DrissionPage import ChromiumPage, ChromiumOptions
+import atexit
 import json
 import os
+import queue
+import threading
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional, Dict
 
+# DrissionPage is heavy to import; load it on first browser launch
+_DrissionPage = None
+
+def _lazy_import():
+    global _DrissionPage
+    if _DrissionPage is None:
+        import DrissionPage as _DrissionPage
+    return _DrissionPage
+
 class StealthBrowser:
     """
     A stealth browser wrapper using DrissionPage to bypass detection adjustments.
     """
     def __init__(self, headless: bool = True, session_name: Optional[str] = None):
+        dp = _lazy_import()
         self.session_name = session_name
-        self.options = ChromiumOptions()
+        self.options = dp.ChromiumOptions()
         
         # Core stealth settings
         if headless:
@@ -23,7 +36,7 @@ class StealthBrowser:
         self.options.set_user_agent(user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36')
 
         # Connect/Launch
-        self.page = ChromiumPage(self.options)
+        self.page = dp.ChromiumPage(self.options)
         
         # Load session if provided
         if session_name:
@@ -69,24 +82,67 @@ class StealthBrowser:
     def close(self):
         self.page.quit()
 
+# Warm headless browsers per session name, reused across tool calls
+BROWSER_POOL_SIZE = 4
+_BROWSER_POOL: Dict[str, "queue.Queue[StealthBrowser]"] = defaultdict(lambda: queue.Queue(maxsize=BROWSER_POOL_SIZE))
+_POOL_LOCK = threading.Lock()
+
+def _checkout_browser(session: Optional[str]) -> "StealthBrowser":
+    """Take an idle headless browser for this session, launching one if none is free."""
+    with _POOL_LOCK:
+        pool = _BROWSER_POOL[session or "_default"]
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        return StealthBrowser(headless=True, session_name=session)
+
+def _checkin_browser(browser: "StealthBrowser", session: Optional[str]):
+    """Reset a browser and return it to its pool, or quit it if the pool is full."""
+    with _POOL_LOCK:
+        pool = _BROWSER_POOL[session or "_default"]
+    try:
+        browser.page.get("about:blank")
+        pool.put_nowait(browser)
+    except Exception:
+        browser.close()
+
+@atexit.register
+def _close_pooled_browsers():
+    with _POOL_LOCK:
+        pools = list(_BROWSER_POOL.values())
+    for pool in pools:
+        while True:
+            try:
+                browser = pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                browser.close()
+            except Exception:
+                pass
+
 def open_stealth_browser(url: str, headless: bool = True, session: Optional[str] = None) -> str:
     """
     Tool function to open a URL in stealth mode.
     Returns the page title or status.
     """
-    browser = StealthBrowser(headless=headless, session_name=session)
-    try:
-        browser.navigate(url)
-        title = browser.page.title
-        if session:
-            browser.save_session()
-        return f"Successfully opened {url}. Page Title: {title}"
-    finally:
-        if headless:
+    if headless:
+        browser = _checkout_browser(session)
+        try:
+            browser.navigate(url)
+            title = browser.page.title
+            if session:
+                browser.save_session()
+        except Exception:
             browser.close()
-        else:
-            # In headed mode, we might want to keep it open? 
-            # For now, let's close it to avoid zombie processes unless specified otherwise.
-            # Or assume the user wants to see it and then we detach? 
-            # DrissionPage detaches by default if we don't quit.
-            pass
+            raise
+        _checkin_browser(browser, session)
+        return f"Successfully opened {url}. Page Title: {title}"
+
+    # Headed mode is left open for the user; DrissionPage detaches if we don't quit
+    browser = StealthBrowser(headless=False, session_name=session)
+    browser.navigate(url)
+    title = browser.page.title
+    if session:
+        browser.save_session()
+    return f"Successfully opened {url}. Page Title: {title}"
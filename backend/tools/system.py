@@ -1,64 +1,89 @@
 import os
+import stat
+import asyncio
+import locale
+import shutil
 import subprocess
 import platform
 import glob
 from typing import List, Dict, Union, Optional
 
+SHELL_TIMEOUT_S = 30
+
 class SystemTools:
     """
     High-privilege system tools for 'True Jarvis' mode.
     WARNING: These tools bypass the sandbox. Secure consent required.
     """
     
+    def __init__(self):
+        # Resolve the platform once instead of on every launch
+        self._launcher = {
+            "Windows": self._launch_windows,
+            "Darwin": self._launch_macos,
+        }.get(platform.system(), self._launch_linux)
+
     def open_application(self, app_name: str) -> str:
         """
         Open a local application.
         Args:
             app_name: Name of the application or executable path
         """
-        system = platform.system()
         try:
-            if system == "Windows":
-                # Try simple start first
-                try:
-                    os.startfile(app_name)
-                    return f"Launched {app_name}"
-                except FileNotFoundError:
-                    # Try using 'start' command which handles PATH better
-                    subprocess.run(f"start {app_name}", shell=True, check=True)
-                    return f"Launched {app_name} via shell"
-            elif system == "Darwin": # macOS
-                subprocess.run(["open", "-a", app_name], check=True)
-                return f"Launched {app_name}"
-            else: # Linux
-                subprocess.run(["xdg-open", app_name], check=True)
-                return f"Launched {app_name}"
+            return self._launcher(app_name)
         except Exception as e:
             return f"Failed to launch {app_name}: {str(e)}"
 
-    def execute_shell(self, command: str) -> str:
+    def _launch_windows(self, app_name: str) -> str:
+        if shutil.which(app_name) or os.path.exists(app_name):
+            os.startfile(app_name)
+            return f"Launched {app_name}"
+        # 'start' also resolves registered App Paths (e.g. chrome) that are not on PATH
+        subprocess.run(["cmd", "/c", "start", "", app_name], check=True)
+        return f"Launched {app_name} via shell"
+
+    def _launch_macos(self, app_name: str) -> str:
+        subprocess.run(["open", "-a", app_name], check=True)
+        return f"Launched {app_name}"
+
+    def _launch_linux(self, app_name: str) -> str:
+        subprocess.run(["xdg-open", app_name], check=True)
+        return f"Launched {app_name}"
+
+    async def execute_shell(self, command: str) -> str:
         """
-        Execute a shell command.
+        Execute a shell command without blocking the event loop.
         Args:
             command: The command to execute (e.g. 'dir', 'ipconfig')
         """
         try:
-            # Use PowerShell on Windows for better consistency
-            shell_cmd = ["powershell", "-Command", command] if platform.system() == "Windows" else command
+            if platform.system() == "Windows":
+                # PowerShell for consistency; -NoProfile skips the per-launch profile load
+                proc = await asyncio.create_subprocess_exec(
+                    "powershell", "-NoProfile", "-Command", command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            else:
+                proc = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            
+            try:
+                async with asyncio.timeout(SHELL_TIMEOUT_S):
+                    stdout, stderr = await proc.communicate()
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return f"Command timed out after {SHELL_TIMEOUT_S} seconds."
             
-            result = subprocess.run(
-                command, 
-                shell=True, 
-                capture_output=True, 
-                text=True, 
-                timeout=30
-            )
-            output = result.stdout
-            if result.stderr:
-                output += f"\nErrors:\n{result.stderr}"
+            encoding = locale.getpreferredencoding(False)
+            output = stdout.decode(encoding, errors="replace")
+            if stderr:
+                output += f"\nErrors:\n{stderr.decode(encoding, errors='replace')}"
             return output.strip() or "Command executed with no output."
-        except subprocess.TimeoutExpired:
-            return "Command timed out after 30 seconds."
         except Exception as e:
             return f"Execution error: {str(e)}"
 
@@ -68,19 +93,29 @@ class SystemTools:
         Args:
             path: Absolute or relative path
         """
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return f"Path not found: {path}"
+        except Exception as e:
+            return f"Access error: {str(e)}"
             
         try:
-            if os.path.isdir(path):
-                items = os.listdir(path)
+            if stat.S_ISDIR(st.st_mode):
+                with os.scandir(path) as it:
+                    items = [entry.name for entry in it]
                 return f"Directory {path} contains:\n" + "\n".join(items)
             else:
-                with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read(4096) # Read first 4KB
-                    if len(content) == 4096:
-                        content += "\n... (truncated)"
-                    return content
+                # Read one byte past the limit to detect truncation without checking the size
+                fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+                try:
+                    buf = os.read(fd, 4097)
+                finally:
+                    os.close(fd)
+                content = buf[:4096].decode('utf-8', errors='ignore') # Read first 4KB
+                if len(buf) > 4096:
+                    content += "\n... (truncated)"
+                return content
         except Exception as e:
             return f"Access error: {str(e)}"
 
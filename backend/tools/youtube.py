@@ -1,6 +1,79 @@
-import yt_dlp
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import os
+import re
+import json
+import gzip
+import hashlib
+import atexit
+import threading
+import contextlib
+from collections import defaultdict
+from pathlib import Path
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+# Header, cue-number, timestamp and blank lines of a WebVTT file. A digits-only line
+# counts as a cue number only right before a timing line; otherwise it is caption text
+_VTT_STRIP = re.compile(r'^(WEBVTT.*|\d+(?=\n.*-->)|.*-->.*|\s*)$\n?', re.MULTILINE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# yt_dlp builds a large extractor registry on import; defer it to first use
+_yt_dlp = None
+
+def _lazy_import():
+    global _yt_dlp
+    if _yt_dlp is None:
+        import yt_dlp as _yt_dlp
+    return _yt_dlp
+
+# Metadata lookups are repeated often within one conversation; keep them for 10 minutes
+_metadata_cache = TTLCache(maxsize=1024, ttl=600) if TTLCache else None
+_metadata_lock = threading.Lock()
+
+# Cleaned transcripts persisted across processes as gzipped JSON
+TRANSCRIPT_CACHE_DIR = Path.home() / ".jarvis" / "yt_cache"
+
+def _transcript_cache_path(url: str, lang: str) -> Path:
+    """Cache file for a transcript, keyed by video id when the URL is a YouTube one."""
+    from yt_dlp.extractor.youtube import YoutubeIE
+    video_key = YoutubeIE.get_temp_id(url) or hashlib.sha1(url.encode()).hexdigest()
+    return TRANSCRIPT_CACHE_DIR / f"{video_key}.{lang}.json.gz"
+
+def _read_cached_transcript(path: Path) -> Optional[str]:
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)["transcript"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+def _write_cached_transcript(path: Path, transcript: str):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+            json.dump({"transcript": transcript}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+# YoutubeDL instances are costly to build, so idle ones are kept per option set. They hold
+# per-download state, so each is checked out by one call at a time
+_YDL_POOL: Dict[str, List["yt_dlp.YoutubeDL"]] = defaultdict(list)
+_YDL_POOL_LOCK = threading.Lock()
+
+@atexit.register
+def _close_pooled_ydls():
+    with _YDL_POOL_LOCK:
+        idle = [ydl for pool in _YDL_POOL.values() for ydl in pool]
+        _YDL_POOL.clear()
+    for ydl in idle:
+        try:
+            ydl.close()
+        except Exception:
+            pass
 
 class YouTubeTool:
     def __init__(self, download_path: str = "downloads"):
@@ -8,18 +81,45 @@ class YouTubeTool:
         if not os.path.exists(download_path):
             os.makedirs(download_path)
 
+    @staticmethod
+    @contextlib.contextmanager
+    def _ydl(opts: Dict[str, Any]):
+        """Check out an idle YoutubeDL for these options, building one if none is free."""
+        key = json.dumps(opts, sort_keys=True)
+        with _YDL_POOL_LOCK:
+            pool = _YDL_POOL[key]
+            ydl = pool.pop() if pool else None
+        if ydl is None:
+            ydl = _lazy_import().YoutubeDL(opts)
+        try:
+            yield ydl
+        finally:
+            with _YDL_POOL_LOCK:
+                _YDL_POOL[key].append(ydl)
+
     def get_metadata(self, url: str) -> Dict[str, Any]:
         """Fetch video metadata."""
+        if _metadata_cache is not None:
+            with _metadata_lock:
+                cached = _metadata_cache.get(url)
+            if cached is not None:
+                return dict(cached)
+
         ydl_opts = {'quiet': True, 'no_warnings': True}
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            return {
-                'title': info.get('title'),
-                'channel': info.get('uploader'),
-                'views': info.get('view_count'),
-                'duration': info.get('duration'),
-                'description': info.get('description'),
-            }
+        # process=False skips format resolution, which none of these fields need
+        with self._ydl(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False, process=False)
+        metadata = {
+            'title': info.get('title'),
+            'channel': info.get('uploader'),
+            'views': info.get('view_count'),
+            'duration': info.get('duration'),
+            'description': info.get('description'),
+        }
+        if _metadata_cache is not None:
+            with _metadata_lock:
+                _metadata_cache[url] = metadata
+        return dict(metadata)
 
     def get_transcript(self, url: str, lang: str = 'en') -> str:
         """Download transcript/subtitles."""
@@ -27,6 +127,11 @@ class YouTubeTool:
         # This is a bit tricky to return directly as text without file I/O.
         # Capability: Download auto-subs, convert to text.
         
+        cache_path = _transcript_cache_path(url, lang)
+        cached = _read_cached_transcript(cache_path)
+        if cached is not None:
+            return cached
+
         ydl_opts = {
             'skip_download': True,
             'writeautomaticsub': True,
@@ -36,29 +141,29 @@ class YouTubeTool:
             'quiet': True,
         }
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with self._ydl(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=False)
             video_id = info['id']
-            ydl.download([url])
-            
-            # Check for vtt file
-            potential_files = [
-                f"{video_id}.{lang}.vtt",
-                f"{video_id}.en.vtt" # Fallback
-            ]
-            
-            content = "Transcript not found."
-            for fname in potential_files:
-                fpath = os.path.join(self.download_path, fname)
-                if os.path.exists(fpath):
-                    with open(fpath, 'r', encoding='utf-8') as f:
-                        # Simple cleanup of VTT
-                        lines = f.readlines()
-                        # basic filter for timestamps and headers
-                        content = " ".join([l.strip() for l in lines if '-->' not in l and l.strip() and not l.startswith('WEBVTT')])
-                    break
-            
-            return content
+            # Write subtitles from the info we already have instead of re-extracting
+            ydl.process_info(info)
+        
+        # Check for vtt file
+        potential_files = [
+            f"{video_id}.{lang}.vtt",
+            f"{video_id}.en.vtt" # Fallback
+        ]
+        
+        content = "Transcript not found."
+        for fname in potential_files:
+            fpath = os.path.join(self.download_path, fname)
+            if os.path.exists(fpath):
+                with open(fpath, 'r', encoding='utf-8') as f:
+                    # Strip headers and timestamps in one pass, then collapse whitespace
+                    content = _WHITESPACE_RE.sub(' ', _VTT_STRIP.sub('', f.read())).strip()
+                _write_cached_transcript(cache_path, content)
+                break
+        
+        return content
 
     def download_video(self, url: str, resolution: str = "720") -> str:
         """Download video file."""
@@ -66,7 +171,7 @@ class YouTubeTool:
             'format': f'bestvideo[height<={resolution}]+bestaudio/best[height<={resolution}]',
             'outtmpl': os.path.join(self.download_path, '%(title)s.%(ext)s'),
         }
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with self._ydl(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=True)
             return ydl.prepare_filename(info)
 
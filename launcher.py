@@ -1,6 +1,10 @@
 import os
 import sys
+import runpy
+import select
+import shutil
 import subprocess
+import threading
 import time
 import webbrowser
 from pathlib import Path
@@ -55,6 +59,75 @@ def ensure_ollama_running():
         print_status("Ollama executable not found. Please install Ollama from ollama.com")
         return False
 
+def _wait_pidfd(processes):
+    """Linux >= 5.3: sleep in epoll until a child's pidfd becomes readable (i.e. it exited)."""
+    ep = select.epoll()
+    fds = {}
+    try:
+        for name, proc in processes.items():
+            fd = os.pidfd_open(proc.pid)
+            fds[fd] = name
+            ep.register(fd, select.EPOLLIN)
+        events = ep.poll()
+        return fds[events[0][0]]
+    finally:
+        ep.close()
+        for fd in fds:
+            os.close(fd)
+
+def _wait_windows(processes):
+    """Windows: wait on the process handles; the 1s timeout keeps Ctrl+C responsive."""
+    import ctypes
+    WAIT_TIMEOUT = 0x102
+    WAIT_FAILED = 0xFFFFFFFF
+    names = list(processes)
+    handles = (ctypes.c_void_p * len(names))(*(int(processes[n]._handle) for n in names))
+    wait = ctypes.windll.kernel32.WaitForMultipleObjects
+    wait.restype = ctypes.c_uint32
+    while True:
+        rc = wait(len(names), handles, False, 1000)
+        if rc == WAIT_TIMEOUT:
+            continue
+        if rc == WAIT_FAILED or rc >= len(names):
+            raise OSError(f"WaitForMultipleObjects failed ({rc})")
+        return names[rc]
+
+def _wait_threads(processes):
+    """Fallback: one blocking waiter per service; whichever finishes first wakes us."""
+    done = threading.Event()
+    stopped = []
+    
+    def _watch(name, service):
+        if isinstance(service, threading.Thread):
+            service.join()
+        else:
+            service.wait()
+        stopped.append(name)
+        done.set()
+    
+    for name, service in processes.items():
+        threading.Thread(target=_watch, args=(name, service), daemon=True).start()
+    # Windows lock waits ignore Ctrl+C, so wake once a second there; POSIX blocks outright
+    while not done.wait(timeout=1.0 if os.name == "nt" else None):
+        pass
+    return stopped[0]
+
+def wait_for_any_exit(processes):
+    """Block until one of the named processes (or in-process service threads) exits and return its name."""
+    if any(isinstance(p, threading.Thread) for p in processes.values()):
+        return _wait_threads(processes)
+    if hasattr(os, "pidfd_open") and hasattr(select, "epoll"):
+        try:
+            return _wait_pidfd(processes)
+        except OSError:
+            pass
+    if os.name == "nt":
+        try:
+            return _wait_windows(processes)
+        except (OSError, AttributeError):
+            pass
+    return _wait_threads(processes)
+
 def main():
     print_status("Initializing Jarvis AI Assistant...")
     
@@ -74,19 +147,41 @@ def main():
 
     # Start Backend
     print_status("Launching Backend...")
-    backend_env = os.environ.copy()
     
     # Detect venv
     venv_python = backend_dir / "venv" / "Scripts" / "python.exe"
     python_cmd = str(venv_python) if venv_python.exists() else "python"
     
+    # No shell: each service is a single process rather than a shell plus the program
+    popen_kwargs = {}
+    if os.name == "nt":
+        popen_kwargs["creationflags"] = subprocess.CREATE_NEW_CONSOLE
+    
+    # Already running on the venv interpreter: run the backend here instead of starting another Python
+    run_inprocess = venv_python.exists() and venv_python.resolve() == Path(sys.executable).resolve()
+    if run_inprocess:
+        os.chdir(backend_dir)
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+        from config import settings as backend_settings
+        # uvicorn's auto-reload supervisor installs signal handlers, which needs the main thread
+        run_inprocess = not backend_settings.debug
+    
     try:
-        backend_process = subprocess.Popen(
-            [python_cmd, "main.py"], 
-            cwd=str(backend_dir),
-            shell=True,
-            creationflags=subprocess.CREATE_NEW_CONSOLE
-        )
+        if run_inprocess:
+            backend_process = threading.Thread(
+                target=runpy.run_path,
+                args=(str(backend_dir / "main.py"),),
+                kwargs={"run_name": "__main__"},
+                daemon=True
+            )
+            backend_process.start()
+        else:
+            backend_process = subprocess.Popen(
+                [python_cmd, "main.py"], 
+                cwd=str(backend_dir),
+                **popen_kwargs
+            )
     except Exception as e:
         print_status(f"Failed to start backend: {e}")
         input("Press Enter to exit...")
@@ -94,12 +189,13 @@ def main():
 
     # Start Frontend
     print_status("Launching Frontend...")
+    # npm is a .cmd shim on Windows, which CreateProcess only finds by its full name
+    npm_cmd = shutil.which("npm.cmd" if os.name == "nt" else "npm") or "npm"
     try:
         frontend_process = subprocess.Popen(
-            ["npm", "run", "dev"], 
+            [npm_cmd, "run", "dev"], 
             cwd=str(frontend_dir),
-            shell=True,
-            creationflags=subprocess.CREATE_NEW_CONSOLE
+            **popen_kwargs
         )
     except Exception as e:
         print_status(f"Failed to start frontend: {e}")
@@ -117,15 +213,9 @@ def main():
     print_status("Close the pop-up windows to stop the servers.")
     
     try:
-        while True:
-            time.sleep(1)
-            # Check if processes are alive
-            if backend_process.poll() is not None:
-                print_status("Backend stopped unexpectedly.")
-                break
-            if frontend_process.poll() is not None:
-                print_status("Frontend stopped unexpectedly.")
-                break
+        # Sleep until either child exits instead of waking up every second
+        stopped = wait_for_any_exit({"Backend": backend_process, "Frontend": frontend_process})
+        print_status(f"{stopped} stopped unexpectedly.")
     except KeyboardInterrupt:
         print_status("Stopping...")
     finally: